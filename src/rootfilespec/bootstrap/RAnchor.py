@@ -5,6 +5,7 @@ from rootfilespec.bootstrap.streamedobject import StreamedObject
 from rootfilespec.rntuple.envelope import REnvelopeLocator
 from rootfilespec.rntuple.footer import FooterEnvelope
 from rootfilespec.rntuple.header import HeaderEnvelope
+from rootfilespec.rntuple.pagelocations import fetch_coalesced
 from rootfilespec.rntuple.RLocator import LargeLocator
 from rootfilespec.serializable import (
     Locator,
@@ -62,3 +63,19 @@ class ROOT3a3aRNTuple(StreamedObject):
         loc = self.footer_locator
         buffer = fetch_data(loc)
         return loc.read_from(buffer)
+
+    def get_header_and_footer(
+        self,
+        fetch_data: Callable[[Locator[ROOTSerializable]], ReadBuffer],
+        max_gap: int = 0,
+    ) -> tuple[HeaderEnvelope, FooterEnvelope]:
+        """Reads the RNTuple Header and Footer Envelopes.
+
+        If the two envelopes are at most max_gap bytes apart, both are fetched
+        with a single call to fetch_data, saving a round trip.
+        """
+        header_loc, footer_loc = self.header_locator, self.footer_locator
+        header_buffer, footer_buffer = fetch_coalesced(
+            [header_loc, footer_loc], fetch_data, max_gap
+        )
+        return header_loc.read_from(header_buffer), footer_loc.read_from(footer_buffer)
@@ -75,7 +75,7 @@ class TBasket(TKey):
             # TODO: refactor this to use BasicArray
             (n,), buffer = buffer.unpack(">i")
             assert n == bheader.fNevBuf
-            data, buffer = buffer.consume(n * fEntryOffset.dtype.itemsize)
+            data, buffer = buffer.consume_view(n * fEntryOffset.dtype.itemsize)
             fEntryOffset = np.frombuffer(data, dtype=fEntryOffset.dtype, count=n)
         if base_tkey.header.is_embedded():
             _, buffer = TKey.update_members(
@@ -138,7 +138,7 @@ class TKey(ROOTSerializable):
             msg += f"\n{self=}"
             msg += f"\n{compressed=}"
             msg += f"\n{obj=}"
-            msg += f"\nBuffer: {buffer}"
+            msg += f"\nBuffer: {buffer}\n{buffer.hexdump()}"
             raise ValueError(msg)
         return obj
 
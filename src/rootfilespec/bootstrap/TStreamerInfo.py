@@ -549,22 +549,6 @@ class STLType(IntEnum):
         return f"{self.__class__.__name__}.{self.name}"
 
 
-_cpp_primitives = {
-    "bool": "Annotated[bool, Fmt('>?')]",
-    "char": "Annotated[int, Fmt('>b')]",
-    "unsigned char": "Annotated[int, Fmt('>B')]",
-    "short": "Annotated[int, Fmt('>h')]",
-    "unsigned short": "Annotated[int, Fmt('>H')]",
-    "int": "Annotated[int, Fmt('>i')]",
-    "unsigned int": "Annotated[int, Fmt('>I')]",
-    "Long64_t": "Annotated[int, Fmt('>q')]",
-    "long": "Annotated[int, Fmt('>q')]",
-    "unsigned long": "Annotated[int, Fmt('>Q')]",
-    "float": "Annotated[float, Fmt('>f')]",
-    "double": "Annotated[float, Fmt('>d')]",
-}
-
-
 @serializable
 class TStreamerSTL(TStreamerElement):
     """STL container streamer element.
@@ -239,7 +239,7 @@ def decompress(buffer: ReadBuffer, expected_size: int) -> ReadBuffer:
         msg += f"{compressed.uncompressed_size()} != {expected_size}"
         raise ValueError(msg)
     if buffer:
-        msg = f"Expected buffer to be empty after reading compressed data, but got\n{buffer}"
+        msg = f"Expected buffer to be empty after reading compressed data, but got\n{buffer}\n{buffer.hexdump()}"
         raise ValueError(msg)
     return ReadBuffer(
         compressed.decompress(),
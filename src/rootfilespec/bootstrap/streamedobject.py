@@ -30,6 +30,20 @@ class _StreamConstants(IntEnum):
     """Not sure if this is where it is used"""
 
 
+def _consume_cstring(buffer: ReadBuffer) -> tuple[bytes, ReadBuffer]:
+    """Consume a null-terminated string, returning it without the terminator"""
+    size = 64
+    while True:
+        chunk = buffer.data[:size].tobytes()
+        end = chunk.find(b"\0")
+        if end >= 0:
+            return chunk[:end], buffer.advance(end + 1)
+        if size >= len(buffer):
+            msg = f"No null terminator in buffer of length {len(buffer)}"
+            raise IndexError(msg)
+        size *= 4
+
+
 @dataclass
 class StreamHeader(ROOTSerializable):
     """Initial header for any streamed data object
@@ -79,12 +93,7 @@ class StreamHeader(ROOTSerializable):
             fClassInfo: int = (tmp1 << 16) | tmp2
             if fClassInfo == _StreamConstants.kNewClassTag:
                 fClassRef = buffer.relpos - 4
-                fClassName = b""
-                while True:
-                    chr, buffer = buffer.consume(1)
-                    if chr == b"\0":
-                        break
-                    fClassName += chr
+                fClassName, buffer = _consume_cstring(buffer)
                 # Try to decode to ensure it is a valid name
                 if not fClassName.decode("ascii").isprintable():
                     msg = f"Class name {fClassName!r} is not valid ASCII"
@@ -157,12 +166,12 @@ def read_streamed_item(
     itemheader, _ = StreamHeader.read(buffer)
     if itemheader.fByteCount == 0 and itemheader.fClassRef is not None:
         # This is a reference to another object in the buffer
+        # Only the 4-byte tag is present, skip it without copying
+        buffer = buffer[4:]
         if itemheader.fClassRef == 0:
             # Null reference, return None
-            _, buffer = buffer.consume(4)
             return Ref(None), buffer
         # TODO: fetch the referenced object from the buffer.instance_refs
-        _, buffer = buffer.consume(4)
         return Ref(Some()), buffer
     if itemheader.fClassName:
         clsname = normalize(itemheader.fClassName)
@@ -190,7 +199,7 @@ def read_streamed_item(
     item, buffer = dynmethod(buffer)
     # TODO: register the object addr in the buffer instance_refs
     if buffer:
-        msg = f"Expected buffer to be empty after reading {clsname}, but got\n{buffer}"
+        msg = f"Expected buffer to be empty after reading {clsname}, but got\n{buffer}\n{buffer.hexdump()}"
         raise ValueError(msg)
     return item, remaining
 
@@ -263,6 +272,6 @@ def _read_all_members(
         msg = f"Expected position {end_position} but got {buffer.relpos}"
         msg += f"\nClass: {cls}"
         msg += f"\nMembers: {members}"
-        msg += f"\nBuffer: {buffer}"
+        msg += f"\nBuffer: {buffer}\n{buffer.hexdump()}"
         raise ValueError(msg)
     return members, buffer
@@ -1,5 +1,6 @@
 import dataclasses
 from collections.abc import Hashable
+from functools import cache
 from typing import Any, Generic, TypeVar, get_args, get_origin
 
 import numpy as np
@@ -13,12 +14,49 @@ from rootfilespec.serializable import (
     MemberType,
     ReadBuffer,
     ReadObjMethod,
+    ROOTSerializable,
     _build_read,
+    _ReadWrapper,
 )
-from rootfilespec.structutil import _FmtReader
+from rootfilespec.structutil import _FmtReader, _FusedFmtReader
 
+_np_dtype = cache(np.dtype)
+"""Shared numpy dtype instances, keyed by format string"""
 
-@dataclasses.dataclass
+_pytype_by_kind: dict[str, type] = {"b": bool, "i": int, "u": int, "f": float}
+"""Python type that ndarray.tolist() produces for each numpy dtype kind"""
+
+
+def _to_native(arr: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    """Byteswap an array into native byte order (this makes a copy)"""
+    if arr.dtype.isnative:
+        return arr
+    swapped: np.ndarray[Any, Any] = arr.byteswap()
+    return swapped.view(arr.dtype.newbyteorder("="))
+
+
+def _item_dtype(reader: ReadObjMethod) -> np.dtype[Any] | None:
+    """If the reader reads a single primitive, the dtype to read many at once with"""
+    membermethod = reader.membermethod
+    if isinstance(membermethod, _FmtReader) and membermethod.fmt not in (
+        "float16",
+        "charstar",
+    ):
+        return _np_dtype(membermethod.fmt)
+    return None
+
+
+def _to_pylist(arr: np.ndarray[Any, Any], reader: ReadObjMethod) -> list[Any]:
+    """Convert a bulk read array to the python objects the item reader would produce"""
+    # tolist() converts to python scalars in a single C loop
+    items: list[Any] = arr.tolist()
+    outtype = reader.membermethod.outtype  # type: ignore[attr-defined]
+    if _pytype_by_kind.get(arr.dtype.kind) is not outtype:
+        items = [outtype(x) for x in items]
+    return items
+
+
+@dataclasses.dataclass(slots=True)
 class _ArrayReader:
     """Arrays whose length is set by another member and have a pad byte between them"""
 
@@ -27,6 +65,8 @@ class _ArrayReader:
     sizevar: str
     haspad: bool
     """Whether the array has a pad byte or not"""
+    native: bool = False
+    """Whether to byteswap the array into native byte order"""
 
     def __call__(
         self, members: Members, buffer: ReadBuffer
@@ -38,14 +78,14 @@ class _ArrayReader:
                 # This is the null pad byte that indicates an empty array (even if n > 0)
                 members[self.name] = np.array([], dtype=self.dtype)
                 return members, buffer
-            if pad != b"\x01":
+            # a 0x01 pad byte is only valid in front of a non-empty array
+            # (this sanity check is stripped when running with python -O)
+            if __debug__ and (pad != b"\x01" or n == 0):
                 msg = f"Expected null or 0x01 pad byte but got {pad!r} for size {n}"
                 raise ValueError(msg)
-            if n == 0:
-                msg = "Array size is 0 but pad byte is not null"
-                raise ValueError(msg)
-        data, buffer = buffer.consume(n * self.dtype.itemsize)
-        members[self.name] = np.frombuffer(data, dtype=self.dtype, count=n)
+        data, buffer = buffer.consume_view(n * self.dtype.itemsize)
+        arr = np.frombuffer(data, dtype=self.dtype, count=n)
+        members[self.name] = _to_native(arr) if self.native else arr
         return members, buffer
 
 
@@ -58,27 +98,37 @@ class BasicArray(MemberSerDe):
     """The field that holds the shape of the array."""
     haspad: bool = True
     """Whether the array has a pad byte or not"""
+    native: bool = False
+    """Whether to byteswap the array into native byte order
+
+    By default the array is a zero-copy view of the (big-endian) file data.
+    """
 
     def build_reader(self, fname: str, ftype: type):  # noqa: ARG002
         if self.fmt in ("float16", "double32", "charstar"):
             msg = f"Unimplemented format {self.fmt}"
             raise NotImplementedError(msg)
-        return _ArrayReader(fname, np.dtype(self.fmt), self.shapefield, self.haspad)
+        return _ArrayReader(
+            fname, _np_dtype(self.fmt), self.shapefield, self.haspad, self.native
+        )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class _CArrayReader:
     """Array that has its length at the beginning of the array and has no pad byte"""
 
     name: str
     dtype: np.dtype[Any]
+    native: bool = False
+    """Whether to byteswap the array into native byte order"""
 
     def __call__(
         self, members: Members, buffer: ReadBuffer
     ) -> tuple[Members, ReadBuffer]:
         (n,), buffer = buffer.unpack(">i")
-        data, buffer = buffer.consume(n * self.dtype.itemsize)
-        members[self.name] = np.frombuffer(data, dtype=self.dtype, count=n)
+        data, buffer = buffer.consume_view(n * self.dtype.itemsize)
+        arr = np.frombuffer(data, dtype=self.dtype, count=n)
+        members[self.name] = _to_native(arr) if self.native else arr
         return members, buffer
 
 
@@ -87,25 +137,29 @@ class CArray(MemberSerDe):
     """A class to hold a C array of a given type."""
 
     dtype: str
+    native: bool = False
+    """Whether to byteswap the array into native byte order"""
 
     def build_reader(self, fname: str, ftype: type):  # noqa: ARG002
-        return _CArrayReader(fname, np.dtype(self.dtype))
+        return _CArrayReader(fname, _np_dtype(self.dtype), self.native)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class _FixedSizeArrayReader:
     """Array that has its length at the beginning of the array and has no pad byte"""
 
     name: str
     dtype: np.dtype[Any]
     size: int
+    native: bool = False
+    """Whether to byteswap the array into native byte order"""
 
     def __call__(
         self, members: Members, buffer: ReadBuffer
     ) -> tuple[Members, ReadBuffer]:
-        data, buffer = buffer.consume(self.size * self.dtype.itemsize)
+        data, buffer = buffer.consume_view(self.size * self.dtype.itemsize)
         arg = np.frombuffer(data, dtype=self.dtype, count=self.size)
-        members[self.name] = arg
+        members[self.name] = _to_native(arg) if self.native else arg
         return members, buffer
 
 
@@ -116,19 +170,21 @@ class FixedSizeArray(MemberSerDe):
     Attributes:
         dtype (np.dtype): The format of the array.
         size (int): The size of the array.
+        native (bool): Whether to byteswap the array into native byte order.
     """
 
     fmt: str
     size: int
+    native: bool = False
 
     def build_reader(self, fname: str, ftype: type):  # noqa: ARG002
         if self.fmt in ("float16", "charstar", "double32"):
             msg = f"Unimplemented format {self.fmt}"
             raise NotImplementedError(msg)
-        return _FixedSizeArrayReader(fname, np.dtype(self.fmt), self.size)
+        return _FixedSizeArrayReader(fname, _np_dtype(self.fmt), self.size, self.native)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class _ObjectArrayReader:
     """Array that has its length at the beginning of the array and has no pad byte"""
 
@@ -174,19 +230,38 @@ class ObjectArray(MemberSerDe):
 
 T = TypeVar("T", bound=MemberType)
 
+_default_read = vars(ROOTSerializable)["read"].__func__
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(slots=True)
 class _StdVectorReader:
     name: str
     inner_reader: ReadObjMethod
     hasheader: bool = True
     """When vectors are nested, the StreamHeader is not present in the inner vector."""
+    itemdtype: np.dtype[Any] | None = dataclasses.field(init=False)
+    """If the items are primitives, the dtype to read them all at once with"""
+    itemrecord: _FusedFmtReader | None = dataclasses.field(init=False)
+    """If the items are flat records of primitives, the struct reader for one item"""
+
+    def __post_init__(self):
+        membermethod = self.inner_reader.membermethod
+        self.itemdtype = _item_dtype(self.inner_reader)
+        self.itemrecord = None
+        if self.itemdtype is None and (
+            isinstance(membermethod, _ReadWrapper)
+            and getattr(membermethod.objtype.read, "__func__", None) is _default_read
+        ):
+            # only the class's own record reader, not one inherited from a base
+            recordreader = vars(membermethod.objtype).get("_record_reader")
+            if isinstance(recordreader, _FusedFmtReader):
+                self.itemrecord = recordreader
 
     def __call__(
         self, members: Members, buffer: ReadBuffer
     ) -> tuple[Members, ReadBuffer]:
         members[self.name], buffer = StdVector.read_as(
-            self.inner_reader, self.hasheader, buffer
+            self.inner_reader, self.hasheader, buffer, self.itemdtype, self.itemrecord
         )
         return members, buffer
 
@@ -206,7 +281,14 @@ class StdVector(ContainerSerDe, Generic[T]):
         return _StdVectorReader(fname, inner_reader)
 
     @classmethod
-    def read_as(cls, inner_reader: ReadObjMethod, hasheader: bool, buffer: ReadBuffer):
+    def read_as(
+        cls,
+        inner_reader: ReadObjMethod,
+        hasheader: bool,
+        buffer: ReadBuffer,
+        itemdtype: np.dtype[Any] | None = None,
+        itemrecord: _FusedFmtReader | None = None,
+    ):
         if hasheader:
             header, buffer = StreamHeader.read(buffer)
             if header.fVersion == 1:
@@ -235,14 +317,18 @@ class StdVector(ContainerSerDe, Generic[T]):
                 raise NotImplementedError(msg)
         (n,), buffer = buffer.unpack(">i")
         items: list[T] = []
-        if isinstance(inner_reader.membermethod, _FmtReader):
-            # if the inner reader is a format reader, we can read faster
-            fmt = inner_reader.membermethod.fmt
-            itemsize = np.dtype(fmt).itemsize
-            data, buffer = buffer.consume(n * itemsize)
+        if itemdtype is not None:
+            # primitive items can be read in bulk
+            data, buffer = buffer.consume_view(n * itemdtype.itemsize)
+            arr = np.frombuffer(data, dtype=itemdtype, count=n)
+            return cls(_to_pylist(arr, inner_reader)), buffer
+        if itemrecord is not None:
+            # flat records can be unpacked in bulk, one struct per item
+            objtype = inner_reader.membermethod.objtype  # type: ignore[attr-defined]
+            data, buffer = buffer.consume_view(n * itemrecord.fmtstruct.size)
             items = [
-                inner_reader.membermethod.outtype(x)
-                for x in np.frombuffer(data, dtype=fmt, count=n)
+                objtype(**itemrecord.update_from({}, values))
+                for values in itemrecord.fmtstruct.iter_unpack(data)
             ]
             return cls(items), buffer
         for _ in range(n):
@@ -260,19 +346,31 @@ class StdSet(ContainerSerDe, Generic[T]):
 
     @classmethod
     def build_reader(cls, fname: str, inner_reader: ReadObjMethod):
+        itemdtype = _item_dtype(inner_reader)
+
         def update_members(members: Members, buffer: ReadBuffer):
-            members[fname], buffer = cls.read_as(inner_reader, buffer)
+            members[fname], buffer = cls.read_as(inner_reader, buffer, itemdtype)
             return members, buffer
 
         return update_members
 
     @classmethod
-    def read_as(cls, inner_reader: ReadObjMethod, buffer: ReadBuffer):
+    def read_as(
+        cls,
+        inner_reader: ReadObjMethod,
+        buffer: ReadBuffer,
+        itemdtype: np.dtype[Any] | None = None,
+    ):
         header, buffer = StreamHeader.read(buffer)
         if header.memberwise:
             msg = "Set with memberwise reading"
             raise NotImplementedError(msg)
         (n,), buffer = buffer.unpack(">i")
+        if itemdtype is not None:
+            # primitive items can be read in bulk
+            data, buffer = buffer.consume_view(n * itemdtype.itemsize)
+            arr = np.frombuffer(data, dtype=itemdtype, count=n)
+            return cls(set(_to_pylist(arr, inner_reader))), buffer
         items: set[T] = set()
         for _ in range(n):
             item, buffer = inner_reader(buffer)
@@ -311,19 +409,30 @@ class StdMap(AssociativeContainerSerDe, Generic[K, V]):
     def build_reader(
         cls, fname: str, key_reader: ReadObjMethod, value_reader: ReadObjMethod
     ):
+        keydtype = _item_dtype(key_reader)
+        valuedtype = _item_dtype(value_reader)
+
         def update_members(members: Members, buffer: ReadBuffer):
-            members[fname], buffer = cls.read_as(key_reader, value_reader, buffer)
+            members[fname], buffer = cls.read_as(
+                key_reader, value_reader, buffer, keydtype, valuedtype
+            )
             return members, buffer
 
         return update_members
 
     @classmethod
     def read_as(
-        cls, key_reader: ReadObjMethod, value_reader: ReadObjMethod, buffer: ReadBuffer
+        cls,
+        key_reader: ReadObjMethod,
+        value_reader: ReadObjMethod,
+        buffer: ReadBuffer,
+        keydtype: np.dtype[Any] | None = None,
+        valuedtype: np.dtype[Any] | None = None,
     ):
         # TODO: split this function out into a _StdMapReader with flags
         header, buffer = StreamHeader.read(buffer)
-        items: dict[K, V] = {}
+        keys: list[K] = []
+        values: list[V] = []
         if header.memberwise:
             # member version info precedes the member lists
             # there should only be one member, the std::pair<K, V> type
@@ -333,13 +442,21 @@ class StdMap(AssociativeContainerSerDe, Generic[K, V]):
             # e.g. uproot-issue465-flat.root (has length but incorrect?)
             if n == 0:
                 # empty map, no keys or values
-                return cls(items), buffer
+                return cls({}), buffer
+            if keydtype is not None and valuedtype is not None:
+                # keys then values, each a contiguous run of primitives
+                data, buffer = buffer.consume_view(n * keydtype.itemsize)
+                karr = np.frombuffer(data, dtype=keydtype, count=n)
+                data, buffer = buffer.consume_view(n * valuedtype.itemsize)
+                varr = np.frombuffer(data, dtype=valuedtype, count=n)
+                keys = _to_pylist(karr, key_reader)
+                values = _to_pylist(varr, value_reader)
+                return cls(dict(zip(keys, values, strict=True))), buffer
             end_position = None
             if not isinstance(key_reader.membermethod, _FmtReader):
                 start_position = buffer.relpos
                 keyheader, buffer = StreamHeader.read(buffer)
                 end_position = start_position + keyheader.fByteCount + 4
-            keys: list[K] = []
             for _ in range(n):
                 key, buffer = key_reader(buffer)
                 keys.append(key)
@@ -350,21 +467,30 @@ class StdMap(AssociativeContainerSerDe, Generic[K, V]):
                 start_position = buffer.relpos
                 valueheader, buffer = StreamHeader.read(buffer)
                 end_position = start_position + valueheader.fByteCount + 4
-            for key in keys:
+            for _ in range(n):
                 value, buffer = value_reader(buffer)
-                items[key] = value
+                values.append(value)
             if end_position:
                 assert buffer.relpos == end_position
-            return cls(items), buffer
+            return cls(dict(zip(keys, values, strict=True))), buffer
         (n,), buffer = buffer.unpack(">i")
+        if keydtype is not None and valuedtype is not None:
+            # interleaved key, value pairs of primitives
+            pairdtype = np.dtype([("k", keydtype), ("v", valuedtype)])
+            data, buffer = buffer.consume_view(n * pairdtype.itemsize)
+            arr = np.frombuffer(data, dtype=pairdtype, count=n)
+            keys = _to_pylist(arr["k"], key_reader)
+            values = _to_pylist(arr["v"], value_reader)
+            return cls(dict(zip(keys, values, strict=True))), buffer
         for _ in range(n):
             key, buffer = key_reader(buffer)
             value, buffer = value_reader(buffer)
-            items[key] = value
-        return cls(items), buffer
+            keys.append(key)
+            values.append(value)
+        return cls(dict(zip(keys, values, strict=True))), buffer
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class _StdPairReader:
     name: str
     key_reader: ReadObjMethod
@@ -1,19 +1,25 @@
+from functools import lru_cache
+
 # TODO: is this encoding correct?
 ENCODING = "utf-8"
 
+_NORMALIZE_TABLE = str.maketrans(
+    {
+        ":": "3a",
+        "<": "3c",
+        ">": "3e",
+        ",": "2c",
+        " ": "20",
+        "*": "2a",
+    }
+)
+
 
+@lru_cache(maxsize=4096)
 def normalize(s: bytes) -> str:
     """Convert the ROOT C++ class name to a representation that is valid in Python.
 
     This is used to generate the class name in the DICTIONARY.
     """
     # TODO: #22 append version to all class names
-    return (
-        s.decode(ENCODING)
-        .replace(":", "3a")
-        .replace("<", "3c")
-        .replace(">", "3e")
-        .replace(",", "2c")
-        .replace(" ", "20")
-        .replace("*", "2a")
-    )
+    return s.decode(ENCODING).translate(_NORMALIZE_TABLE)
@@ -1,9 +1,12 @@
 import dataclasses
+import hashlib
+import os
 import sys
 import types
 import warnings
+from pathlib import Path
 
-from rootfilespec import bootstrap, generated
+from rootfilespec import __version__, bootstrap, generated
 from rootfilespec.bootstrap.TStreamerInfo import (
     ClassDef,
     TStreamerInfo,
@@ -111,30 +114,56 @@ class DynamicFileContext(FileContext):
         del sys.modules[self.module.__name__]
 
 
-def build_file_context(streamerinfo: bootstrap.TList) -> DynamicFileContext:
+def build_file_context(
+    streamerinfo: bootstrap.TList, cache_dir: Path | None = None
+) -> DynamicFileContext:
+    """Build the file context for the classes described by the streamer info
+
+    The class definitions are rendered to python source and executed in a
+    module named after a hash of the streamer info, which is reused if it was
+    already built in this process. If cache_dir is given, the rendered source
+    is also saved there and reused by later processes (warnings raised while
+    rendering are then only shown the first time). Sources are kept in a
+    subdirectory per rootfilespec version, since rendering may change between
+    versions.
+    """
     # First, calculate a hash of the streamerinfo to define a unique context name
     # The list should have all TStreamerInfo objects, which have checksums,
     # except for one TList of schema evolution data, which we use the dataclass repr
-    checksums: list[int] = []
+    # A hashlib digest is used so the name is the same in every process
+    digest = hashlib.sha256()
     for item in streamerinfo.items:
         if isinstance(item, TStreamerInfo):
-            checksums.append(item.fCheckSum)
+            digest.update(f"{item.fCheckSum};".encode())
         elif isinstance(item, bootstrap.TList):
-            checksums.append(hash(repr(item)))
-    # TODO: hash is not consistent across processes. Does it matter?
-    context_id = hash(tuple(checksums)) & sys.maxsize
+            digest.update(f"{item!r};".encode())
+    context_id = int.from_bytes(digest.digest()[:8], "big") & sys.maxsize
     module_name = f"rootfilespec.generated.{context_id:016x}"
 
     # Now, render streamer info into dataclass definitions and exec them
     if module_name not in sys.modules:
-        classes = streamerinfo_to_classes(streamerinfo)
+        filename = f"<{module_name}>"
+        if cache_dir is None:
+            classes = streamerinfo_to_classes(streamerinfo)
+        else:
+            cache_path = cache_dir / __version__ / f"{context_id:016x}.py"
+            filename = str(cache_path)
+            if cache_path.exists():
+                classes = cache_path.read_text(encoding="utf-8")
+            else:
+                classes = streamerinfo_to_classes(streamerinfo)
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                # write to a temporary file first so readers never see a partial file
+                tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+                tmp_path.write_text(classes, encoding="utf-8")
+                tmp_path.replace(cache_path)
         module = types.ModuleType(module_name)
         sys.modules[module.__name__] = module
         module.__dict__.update(
             {k: v for k, v in generated.__dict__.items() if not k.startswith("__")}
         )
         try:
-            exec(classes, module.__dict__)
+            exec(compile(classes, filename, "exec"), module.__dict__)
         except:
             # If there is an error in the classes, we want to remove the module
             # from sys.modules so it can be retried later
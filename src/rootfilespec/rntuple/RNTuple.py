@@ -1,6 +1,10 @@
 import dataclasses
-from collections.abc import Callable
-from math import ceil
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor
+from functools import cached_property
+from typing import Any
+
+import numpy as np
 
 from rootfilespec.bootstrap.RAnchor import ROOT3a3aRNTuple
 from rootfilespec.rntuple.envelope import RFeatureFlags
@@ -18,7 +22,7 @@ from rootfilespec.rntuple.schema import (
 from rootfilespec.serializable import Locator, ReadBuffer, ROOTSerializable
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SchemaDescription:
     """A class representing the full schema description of an RNTuple.
     It is a combination of the schema description from the header envelope
@@ -71,7 +75,7 @@ class SchemaDescription:
         )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class InterpretablePage:
     """A class representing an interpretable page description.
     It provides the page description, uncompressed size, and column type.
@@ -85,6 +89,17 @@ class InterpretablePage:
     """The type of the column this page belongs to, e.g. kInt32, kFloat64, etc."""
 
 
+PAGE_DTYPE = np.dtype(
+    [
+        ("nElements", np.int32),
+        ("offset", np.uint64),
+        ("size", np.uint64),
+        ("uncompressedSize", np.uint64),
+    ]
+)
+"""The record layout of the page table returned by RNTuple.get_column_pages"""
+
+
 @dataclasses.dataclass
 class RNTuple:
     """A class representing an RNTuple."""
@@ -98,16 +113,31 @@ class RNTuple:
         cls,
         anchor: ROOT3a3aRNTuple,
         fetch_data: Callable[[Locator[ROOTSerializable]], ReadBuffer],
+        executor: Executor | None = None,
+        max_gap: int | None = None,
     ) -> "RNTuple":
-        """Reads the RNTuple from the given anchor."""
-        headerEnvelope = anchor.get_header(fetch_data)
-        footerEnvelope = anchor.get_footer(fetch_data)
+        """Reads the RNTuple from the given anchor.
+
+        If an executor is given, the page list envelopes are fetched concurrently.
+        If max_gap is given instead, envelopes that are at most max_gap bytes
+        apart are fetched together, see FooterEnvelope.get_pagelists.
+        """
+        if executor is not None and max_gap is not None:
+            msg = "RNTuple.from_anchor: executor and max_gap are mutually exclusive"
+            raise ValueError(msg)
+        if max_gap is None:
+            headerEnvelope = anchor.get_header(fetch_data)
+            footerEnvelope = anchor.get_footer(fetch_data)
+        else:
+            headerEnvelope, footerEnvelope = anchor.get_header_and_footer(
+                fetch_data, max_gap
+            )
 
         # Verify header checksum in footer
         if footerEnvelope.headerChecksum != headerEnvelope.checksum:
             msg = f"Header checksum mismatch: {footerEnvelope.headerChecksum} != {headerEnvelope.checksum}"
             raise ValueError(msg)
-        pagelistEnvelopes = footerEnvelope.get_pagelists(fetch_data)
+        pagelistEnvelopes = footerEnvelope.get_pagelists(fetch_data, executor, max_gap)
 
         # Verify header checksum in each PageListEnvelope
         for pagelistEnvelope in pagelistEnvelopes:
@@ -117,12 +147,12 @@ class RNTuple:
 
         return cls(headerEnvelope, footerEnvelope, pagelistEnvelopes)
 
-    @property
+    @cached_property
     def featureFlags(self) -> RFeatureFlags:
         """Returns the logical or of the feature flags from the header and footer envelopes."""
         return self.headerEnvelope.featureFlags | self.footerEnvelope.featureFlags
 
-    @property
+    @cached_property
     def schemaDescription(self) -> SchemaDescription:
         """Returns the full schema description, from the header envelope but including footer information."""
         return SchemaDescription.from_envelopes(
@@ -139,30 +169,123 @@ class RNTuple:
         Args:
             includeSuppressed (bool): If False, skip suppressed columns.
         """
-        envelopePages: list[list[list[list[InterpretablePage]]]] = [
-            [
+        columnDescriptions = self.schemaDescription.columnDescriptions
+        envelopePages: list[list[list[list[InterpretablePage]]]] = []
+        for pagelistEnvelope in self.pagelistEnvelopes:
+            clusterColumns = [
                 [
-                    [
-                        InterpretablePage(
-                            pageDescription=page_description,
-                            uncompressedSize=ceil(
-                                abs(page_description.fNElements)
-                                * column_description.fBitsOnStorage
-                                / 8
-                            ),  # Convert bits to bytes
-                            columnType=column_description.fColumnType,
-                        )
-                        for page_description in pagelist
-                    ]
+                    (pagelist, column_description)
                     for pagelist, column_description in zip(
-                        columnlist,
-                        self.schemaDescription.columnDescriptions,
-                        strict=False,
+                        columnlist, columnDescriptions, strict=False
                     )
                     if includeSuppressed or pagelist.elementoffset >= 0
                 ]
                 for columnlist in pagelistEnvelope.pageLocations
             ]
+            # Compute the uncompressed sizes of all pages in the envelope at once
+            columns = [column for columns in clusterColumns for column in columns]
+            npages = [len(pagelist) for pagelist, _ in columns]
+            nelements = np.fromiter(
+                (
+                    page_description.fNElements
+                    for pagelist, _ in columns
+                    for page_description in pagelist
+                ),
+                dtype=np.int64,
+                count=sum(npages),
+            )
+            bitsOnStorage = np.repeat(
+                np.array([cd.fBitsOnStorage for _, cd in columns], dtype=np.int64),
+                npages,
+            )
+            # Convert bits to bytes, rounding up
+            sizes = iter(((np.abs(nelements) * bitsOnStorage + 7) >> 3).tolist())
+            envelopePages.append(
+                [
+                    [
+                        [
+                            InterpretablePage(
+                                pageDescription=page_description,
+                                uncompressedSize=next(sizes),
+                                columnType=column_description.fColumnType,
+                            )
+                            for page_description in pagelist
+                        ]
+                        for pagelist, column_description in columns
+                    ]
+                    for columns in clusterColumns
+                ]
+            )
+        return envelopePages
+
+    def iter_column_pages(
+        self,
+        columnIndex: int,
+        includeSuppressed: bool = False,
+    ) -> Iterator[InterpretablePage]:
+        """Lazily yields the pages of a single column, in cluster order.
+
+        Unlike get_extended_page_descriptions, only the page lists of the
+        requested column are visited.
+
+        Args:
+            columnIndex (int): The index of the column in the schema description.
+            includeSuppressed (bool): If False, skip clusters where the column is suppressed.
+        """
+        column_description = self.schemaDescription.columnDescriptions[columnIndex]
+        bitsOnStorage = column_description.fBitsOnStorage
+        for pagelistEnvelope in self.pagelistEnvelopes:
+            for columnlist in pagelistEnvelope.pageLocations:
+                if columnIndex >= len(columnlist):
+                    # column was added by a later schema extension
+                    continue
+                pagelist = columnlist[columnIndex]
+                if not includeSuppressed and pagelist.elementoffset < 0:
+                    continue
+                for page_description in pagelist:
+                    nelements = page_description.fNElements
+                    if nelements < 0:
+                        nelements = -nelements
+                    yield InterpretablePage(
+                        pageDescription=page_description,
+                        # Convert bits to bytes, rounding up
+                        uncompressedSize=(nelements * bitsOnStorage + 7) >> 3,
+                        columnType=column_description.fColumnType,
+                    )
+
+    def get_column_pages(
+        self,
+        columnIndex: int,
+        includeSuppressed: bool = False,
+    ) -> np.ndarray[Any, np.dtype[np.void]]:
+        """Returns the pages of a single column, in cluster order, as a structured array.
+
+        Each record has the fields of PAGE_DTYPE. This is a compact alternative to
+        iter_column_pages that does not build an InterpretablePage per page.
+
+        Args:
+            columnIndex (int): The index of the column in the schema description.
+            includeSuppressed (bool): If False, skip clusters where the column is suppressed.
+        """
+        column_description = self.schemaDescription.columnDescriptions[columnIndex]
+        pages = [
+            (
+                page_description.fNElements,
+                page_description.offset,
+                page_description.size,
+                0,
+            )
             for pagelistEnvelope in self.pagelistEnvelopes
+            for columnlist in pagelistEnvelope.pageLocations
+            # the column may have been added by a later schema extension
+            if columnIndex < len(columnlist)
+            and (includeSuppressed or columnlist[columnIndex].elementoffset >= 0)
+            for page_description in columnlist[columnIndex]
         ]
-        return envelopePages
+        table = np.array(pages, dtype=PAGE_DTYPE)
+        # Convert bits to bytes, rounding up
+        nelements = np.abs(table["nElements"].astype(np.int64))
+        table["uncompressedSize"] = (
+            nelements * column_description.fBitsOnStorage + 7
+        ) >> 3
+        return table
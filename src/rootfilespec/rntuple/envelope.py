@@ -2,6 +2,7 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Annotated, Generic, TypeVar, cast
 
+import xxhash
 from typing_extensions import Self
 
 from rootfilespec.bootstrap.compression import decompress
@@ -76,6 +77,7 @@ class REnvelope(ROOTSerializable):
         """Reads an REnvelope from the given buffer."""
         #### Save initial buffer position (for checking unknown bytes)
         payload_start_pos = buffer.relpos
+        envelope_data = buffer.data
 
         #### Get the first 64bit integer (lengthType) which contains the length and type of the envelope
         # lengthType, buffer = buffer.consume(8)
@@ -108,6 +110,11 @@ class REnvelope(ROOTSerializable):
 
         #### Get the checksum (appended to envelope when writing to disk)
         (checksum,), buffer = buffer.unpack("<Q")  # Last 8 bytes of the envelope
+        # The checksum is the XXH3-64 hash of everything that precedes it
+        computed = xxhash.xxh3_64_intdigest(envelope_data[: length - 8])
+        if computed != checksum:
+            msg = f"Checksum mismatch for envelope of type {typeID}: {computed} != {checksum}"
+            raise ValueError(msg)
         members["checksum"] = checksum
         envelope = cls(**members)
         envelope._unknown = _unknown
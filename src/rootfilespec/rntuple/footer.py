@@ -1,4 +1,5 @@
 from collections.abc import Callable
+from concurrent.futures import Executor
 from typing import Annotated
 
 from rootfilespec.rntuple.envelope import (
@@ -9,6 +10,7 @@ from rootfilespec.rntuple.envelope import (
     RFeatureFlags,
 )
 from rootfilespec.rntuple.pagelist import PageListEnvelope
+from rootfilespec.rntuple.pagelocations import fetch_coalesced
 from rootfilespec.rntuple.RFrame import ListFrame, RecordFrame
 from rootfilespec.rntuple.schema import (
     AliasColumnDescription,
@@ -101,13 +103,37 @@ class FooterEnvelope(REnvelope):
         ]
 
     def get_pagelists(
-        self, fetch_data: Callable[[Locator[ROOTSerializable]], ReadBuffer]
+        self,
+        fetch_data: Callable[[Locator[ROOTSerializable]], ReadBuffer],
+        executor: Executor | None = None,
+        max_gap: int | None = None,
     ) -> list[PageListEnvelope]:
         """Get the RNTuple Page List Envelopes from the Footer Envelope.
 
         Page List Envelope Links are stored in the Cluster Group Record Frames in the Footer Envelope Payload.
+
+        If an executor is given, the envelopes are fetched and read concurrently
+        through it, which overlaps the fetch latency for remote files.
+        If max_gap is given instead, envelopes that are at most max_gap bytes
+        apart are fetched with a single call to fetch_data.
         """
-        return [loc.read_from(fetch_data(loc)) for loc in self.pagelist_locators]
+        if max_gap is not None:
+            if executor is not None:
+                msg = "FooterEnvelope.get_pagelists: executor and max_gap are mutually exclusive"
+                raise ValueError(msg)
+            locators = self.pagelist_locators
+            buffers = fetch_coalesced(locators, fetch_data, max_gap)
+            return [
+                loc.read_from(buffer)
+                for loc, buffer in zip(locators, buffers, strict=True)
+            ]
+
+        def fetch(loc: REnvelopeLocator[PageListEnvelope]) -> PageListEnvelope:
+            return loc.read_from(fetch_data(loc))
+
+        if executor is None:
+            return [fetch(loc) for loc in self.pagelist_locators]
+        return list(executor.map(fetch, self.pagelist_locators))
 
 
 ENVELOPE_TYPE_MAP[0x02] = "FooterEnvelope"
@@ -1,11 +1,12 @@
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Annotated, cast
 
 from rootfilespec.bootstrap.compression import RCompressionSettings
 from rootfilespec.rntuple.RFrame import Item, ListFrame
-from rootfilespec.rntuple.RLocator import RLocator
+from rootfilespec.rntuple.RLocator import LargeLocator, RLocator
 from rootfilespec.rntuple.RPage import RPage
 from rootfilespec.serializable import (
+    BufferContext,
     Locator,
     ReadBuffer,
     ROOTSerializable,
@@ -70,6 +71,64 @@ class RPageDescription(ROOTSerializable):
         return self.read_from(buffer)
 
 
+def fetch_coalesced(
+    locators: Sequence[Locator[ROOTSerializable]],
+    fetch_data: Callable[[Locator[ROOTSerializable]], ReadBuffer],
+    max_gap: int = 0,
+) -> list[ReadBuffer]:
+    """Fetches the data of several locators, merging nearby byte ranges.
+
+    Locators whose byte ranges are at most max_gap bytes apart are fetched
+    with a single call to fetch_data. The returned buffers are in the order of
+    the given locators, and are views into the merged data where applicable.
+    """
+    order = sorted(range(len(locators)), key=lambda i: locators[i].offset)
+    buffers: list[ReadBuffer | None] = [None] * len(locators)
+    first = 0
+    while first < len(order):
+        start = locators[order[first]].offset
+        stop = start + locators[order[first]].size
+        last = first + 1
+        while last < len(order) and locators[order[last]].offset - stop <= max_gap:
+            loc = locators[order[last]]
+            stop = max(stop, loc.offset + loc.size)
+            last += 1
+        if last - first == 1:
+            buffers[order[first]] = fetch_data(locators[order[first]])
+        else:
+            # the merged range is read as one raw page spanning all the locators
+            span = RPageDescription(0, LargeLocator(stop - start, start))
+            buffer = fetch_data(span)
+            for i in order[first:last]:
+                loc = locators[i]
+                begin = loc.offset - start
+                buffers[i] = ReadBuffer(
+                    buffer.data[begin : begin + loc.size],
+                    0,
+                    buffer.file_context,
+                    BufferContext(abspos=loc.offset),
+                )
+        first = last
+    return cast(list[ReadBuffer], buffers)
+
+
+def get_pages(
+    pageDescriptions: Sequence[RPageDescription],
+    fetch_data: Callable[[Locator[ROOTSerializable]], ReadBuffer],
+    max_gap: int = 0,
+) -> list[RPage]:
+    """Reads several pages, in the given order.
+
+    Pages that are at most max_gap bytes apart in the file are fetched with a
+    single call to fetch_data, so that neighbouring pages cost one round trip.
+    """
+    buffers = fetch_coalesced(pageDescriptions, fetch_data, max_gap)
+    return [
+        pageDescription.read_from(buffer)
+        for pageDescription, buffer in zip(pageDescriptions, buffers, strict=True)
+    ]
+
+
 @serializable
 class PageLocations(ListFrame[Item]):
     """A class representing the RNTuple Page Locations Pages (Inner) List Frame.
@@ -1,10 +1,15 @@
 import dataclasses
+import hashlib
+import linecache
 import struct
 from collections.abc import Callable
+from functools import lru_cache
 from inspect import get_annotations
+from types import CodeType, FunctionType
 from typing import (
     Annotated,
     Any,
+    ClassVar,
     Protocol,
     TypeVar,
     get_args,
@@ -75,7 +80,7 @@ class BufferContext:
     """
 
 
-@dataclasses.dataclass(repr=False)
+@dataclasses.dataclass(repr=False, slots=True)
 class ReadBuffer:
     """A ReadBuffer is a memoryview that keeps track of the absolute and relative
     positions of the data it contains.
@@ -109,36 +114,54 @@ class ReadBuffer:
         return len(self.data)
 
     def __repr__(self) -> str:
-        """Get a string representation of the buffer."""
+        """Get a short string representation of the buffer.
+
+        Use hexdump() to see the data.
+        """
         return (
-            f"ReadBuffer size {len(self.data)} at relpos={self.relpos}"
-            f"\n  File context: {self.file_context}"
-            f"\n  Local context: {self.context}"
-            "\n  data[:0x100]: "
-            + "".join(
-                f"\n    0x{i:03x} | "
-                + self.data[i : i + 16].hex(sep=" ")
-                + " | "
-                + "".join(
-                    chr(c) if 32 <= c < 127 else "." for c in self.data[i : i + 16]
-                )
-                for i in range(0, min(256, len(self)), 16)
-            )
+            f"ReadBuffer(len={len(self.data)}, abspos={self.context.abspos}, "
+            f"relpos={self.relpos})"
+        )
+
+    def hexdump(self, size: int = 256) -> str:
+        """Format up to size bytes of the buffer as hex and ASCII, 16 per line."""
+        return "\n".join(
+            f"0x{i:03x} | "
+            + self.data[i : i + 16].hex(sep=" ")
+            + " | "
+            + "".join(chr(c) if 32 <= c < 127 else "." for c in self.data[i : i + 16])
+            for i in range(0, min(size, len(self)), 16)
         )
 
     def __bool__(self) -> bool:
         return bool(self.data)
 
+    def advance(self, size: int) -> "ReadBuffer":
+        """Get the buffer remaining after skipping the given number of bytes.
+
+        Equivalent to self[size:], without the generic slice handling.
+        """
+        if not 0 <= size <= len(self.data):
+            msg = f"Cannot advance {size} bytes in buffer of length {len(self.data)}"
+            raise IndexError(msg)
+        return ReadBuffer(
+            self.data[size:],
+            self.relpos + size,
+            self.file_context,
+            self.context,
+        )
+
     def unpack(self, fmt: str) -> tuple[tuple[Any, ...], "ReadBuffer"]:
         """Unpack the buffer according to the given format."""
-        size = struct.calcsize(fmt)
-        out = struct.unpack(fmt, self.data[:size])
-        return out, self[size:]
+        out = struct.unpack_from(fmt, self.data)
+        return out, self.advance(struct.calcsize(fmt))
 
     def consume(self, size: int) -> tuple[bytes, "ReadBuffer"]:
         """Consume the given number of bytes from the buffer.
 
-        Returns a copy of the data and the remaining buffer.
+        Returns a copy of the data and the remaining buffer. Use this when
+        the bytes are kept (e.g. as a member value or a dict key); to parse
+        the bytes in place use consume_view() or unpack() instead.
         """
         if size < 0:
             msg = (
@@ -146,14 +169,15 @@ class ReadBuffer:
             )
             raise ValueError(msg)
         out = self.data[:size].tobytes()
-        return out, self[size:]
+        return out, self.advance(size)
 
     def consume_view(self, size: int) -> tuple[memoryview, "ReadBuffer"]:
         """Consume the given number of bytes and return a view (not a copy).
 
-        Use consume() to get a copy.
+        Use consume() to get a copy. Anything built on the view, e.g. a numpy
+        array from np.frombuffer, keeps the underlying buffer alive.
         """
-        return self.data[:size], self[size:]
+        return self.data[:size], self.advance(size)
 
 
 ReadMembersMethod = Callable[[Members, ReadBuffer], tuple[Members, ReadBuffer]]
@@ -172,6 +196,9 @@ class ROOTSerializable:
     A base class for objects that can be serialized and deserialized from a buffer.
     """
 
+    _record_reader: ClassVar[ReadMembersMethod | None] = None
+    """Set by @serializable when all fields of the class are read by one fused struct"""
+
     @classmethod
     def read(cls: type[RT], buffer: ReadBuffer) -> tuple[RT, ReadBuffer]:
         members: Members = {}
@@ -187,18 +214,25 @@ class ROOTSerializable:
         raise NotImplementedError(msg)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class _ReadWrapper:
     fname: str
     objtype: type[ROOTSerializable]
+    read: Callable[[ReadBuffer], tuple[ROOTSerializable, ReadBuffer]] = (
+        dataclasses.field(init=False, repr=False, compare=False)
+    )
+    """The bound read method of objtype"""
+
+    def __post_init__(self):
+        self.read = self.objtype.read
 
     def __call__(self, members: Members, buffer: ReadBuffer):
-        obj, buffer = self.objtype.read(buffer)
+        obj, buffer = self.read(buffer)
         members[self.fname] = obj
         return members, buffer
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ReadObjMethod:
     """A wrapper to read a whole object from a buffer.
 
@@ -310,6 +344,116 @@ def _build_update_members(fname: str, ftype: Any) -> ReadMembersMethod:
     raise ValueError(msg)
 
 
+_StructFields = tuple[tuple[str, int, int, str], ...]
+"""The fields filled by one inlined struct read
+
+Each field is (name, index of first value, index past last value, conversion),
+where the conversion is "store" to keep the unpacked value as is or "call" to
+pass the values to the field type.
+"""
+
+
+@lru_cache(maxsize=1024)
+def _update_members_code(
+    layout: tuple[_StructFields | str | None, ...],
+) -> CodeType:
+    """Compile an update_members body for the given sequence of readers
+
+    Readers with no struct fields (None) are bound as _r0, _r1, ... and
+    called in sequence. A field name stands for a whole object read into that
+    field by the read method bound as _r{i}. Struct reads are inlined: the
+    unpack_from method and size of reader i are bound as _u{i} and _n{i}, and
+    the conversion of its field j as _t{i}_{j}. All of these are keyword-only
+    parameters of the function, to be given as its __kwdefaults__, so they
+    are local variables rather than globals in the body.
+
+    The source is registered in linecache under a name derived from its
+    content, so that tracebacks can show it. Classes with the same layout
+    share the code object and its linecache entry.
+    """
+    params: list[str] = []
+    body: list[str] = []
+    for i, fields in enumerate(layout):
+        if fields is None:
+            params.append(f"_r{i}")
+            body.append(f"    members, buffer = _r{i}(members, buffer)")
+            continue
+        if isinstance(fields, str):
+            params.append(f"_r{i}")
+            body.append(f"    members[{fields!r}], buffer = _r{i}(buffer)")
+            continue
+        params += [f"_u{i}", f"_n{i}"]
+        # name the fields on the line that fails if the buffer is too short
+        fnames = ", ".join(fname for fname, *_ in fields)
+        body.append(f"    values = _u{i}(buffer.data)  # {fnames}")
+        for j, (fname, start, stop, convert) in enumerate(fields):
+            if convert != "store":
+                params.append(f"_t{i}_{j}")
+            if stop != start + 1:
+                value = f"_t{i}_{j}(*values[{start}:{stop}])"
+            elif convert == "call":
+                value = f"_t{i}_{j}(values[{start}])"
+            else:
+                value = f"values[{start}]"
+            body.append(f"    members[{fname!r}] = {value}")
+        body.append(f"    buffer = buffer.advance(_n{i})")
+    signature = ", ".join(
+        ["cls", "members", "buffer", *(["*", *params] if params else [])]
+    )
+    lines = [f"def update_members({signature}):", *body, "    return members, buffer"]
+    source = "\n".join(lines) + "\n"
+    filename = f"<update_members {hashlib.sha1(source.encode()).hexdigest()[:12]}>"
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    module = compile(source, filename, "exec")
+    return next(c for c in module.co_consts if isinstance(c, CodeType))
+
+
+def _build_update_members_method(
+    member_readers: list[ReadMembersMethod],
+) -> Callable[..., tuple[Members, ReadBuffer]]:
+    """Build an update_members function that calls each member reader in order"""
+    # structutil depends on this module, so it can only be imported here
+    from rootfilespec.structutil import _FmtReader, _FusedFmtReader
+
+    layout: list[_StructFields | str | None] = []
+    namespace: dict[str, Any] = {}
+    for i, reader in enumerate(member_readers):
+        if isinstance(reader, _FusedFmtReader):
+            fmtstruct = reader.fmtstruct
+            fnames, outtypes = reader.fnames, reader.outtypes
+            slices = reader.slices or [slice(k, k + 1) for k in range(len(fnames))]
+        elif isinstance(reader, _FmtReader) and reader.fmtstruct is not None:
+            fmtstruct = reader.fmtstruct
+            fnames, outtypes = (reader.fname,), (reader.outtype,)
+            slices = [slice(0, None)]
+        elif isinstance(reader, _ReadWrapper):
+            layout.append(reader.fname)
+            namespace[f"_r{i}"] = reader.read
+            continue
+        else:
+            layout.append(None)
+            namespace[f"_r{i}"] = reader
+            continue
+        # the values struct produces, to see which already have the field type
+        zeros = fmtstruct.unpack(bytes(fmtstruct.size))
+        fields: list[tuple[str, int, int, str]] = []
+        for j, (fname, outtype, valueslice) in enumerate(
+            zip(fnames, outtypes, slices, strict=True)
+        ):
+            start, stop, _ = valueslice.indices(len(zeros))
+            if stop != start + 1 or type(zeros[start]) is not outtype:
+                fields.append((fname, start, stop, "call"))
+                namespace[f"_t{i}_{j}"] = outtype
+            else:
+                fields.append((fname, start, stop, "store"))
+        layout.append(tuple(fields))
+        namespace[f"_u{i}"] = fmtstruct.unpack_from
+        namespace[f"_n{i}"] = fmtstruct.size
+    update_members = FunctionType(_update_members_code(tuple(layout)), {})
+    update_members.__kwdefaults__ = namespace
+    return update_members
+
+
 @dataclass_transform()
 def serializable(cls: type[RT]) -> type[RT]:
     """A decorator to add a update_members method to a class that reads its fields from a buffer.
@@ -336,17 +480,15 @@ def serializable(cls: type[RT]) -> type[RT]:
         for field in _get_annotations(cls)
     ]
 
-    # TODO: scan through and coalesce the _FmtReader objects into a single function call
-
-    @classmethod  # type: ignore[misc]
-    def update_members(
-        _: type[RT], members: Members, buffer: ReadBuffer
-    ) -> tuple[Members, ReadBuffer]:
-        for reader in member_readers:
-            members, buffer = reader(members, buffer)
-        return members, buffer
+    # structutil depends on this module, so it can only be imported here
+    from rootfilespec.structutil import _fuse_fmt_readers, _FusedFmtReader
 
-    cls.update_members = update_members  # type: ignore[assignment]
+    member_readers = _fuse_fmt_readers(member_readers)
+    cls._record_reader = None
+    if len(member_readers) == 1 and isinstance(member_readers[0], _FusedFmtReader):
+        cls._record_reader = member_readers[0]
+    update_members = _build_update_members_method(member_readers)
+    cls.update_members = classmethod(update_members)  # type: ignore[assignment]
     return cls
 
 
@@ -1,25 +1,148 @@
 import dataclasses
 import operator
-from typing import get_args
+import struct
+from collections.abc import Callable
+from typing import Any, get_args
 
-from rootfilespec.serializable import Members, MemberSerDe, ReadBuffer, ROOTSerializable
+from rootfilespec.serializable import (
+    Members,
+    MemberSerDe,
+    ReadBuffer,
+    ReadMembersMethod,
+    ROOTSerializable,
+)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class _FmtReader:
     fname: str
     fmt: str
     outtype: type
+    fmtstruct: struct.Struct | None = dataclasses.field(init=False)
+    """The precompiled format, or None if it is not a struct format"""
+    single: bool = dataclasses.field(init=False)
+    """Whether the format unpacks to exactly one value"""
+
+    def __post_init__(self):
+        if self.fmt in ("float16", "charstar"):
+            self.fmtstruct = None
+            self.single = False
+        else:
+            self.fmtstruct = struct.Struct(self.fmt)
+            self.single = len(self.fmtstruct.unpack(bytes(self.fmtstruct.size))) == 1
 
     def __call__(
         self, members: Members, buffer: ReadBuffer
     ) -> tuple[Members, ReadBuffer]:
-        if self.fmt in ("float16", "charstar"):
+        if self.fmtstruct is None:
             msg = f"Unimplemented format {self.fmt}"
             raise NotImplementedError(msg)
-        tup, buffer = buffer.unpack(self.fmt)
-        members[self.fname] = self.outtype(*tup)
-        return members, buffer
+        tup = self.fmtstruct.unpack_from(buffer.data)
+        if self.single:
+            members[self.fname] = self.outtype(tup[0])
+        else:
+            members[self.fname] = self.outtype(*tup)
+        return members, buffer.advance(self.fmtstruct.size)
+
+
+@dataclasses.dataclass(slots=True)
+class _FusedFmtReader:
+    """Reads several adjacent _FmtReader fields with one struct call"""
+
+    fnames: tuple[str, ...]
+    outtypes: tuple[type, ...]
+    fmtstruct: struct.Struct
+    slices: tuple[slice, ...] | None = None
+    """The values of each field, if any field has other than exactly one value"""
+
+    def __call__(
+        self, members: Members, buffer: ReadBuffer
+    ) -> tuple[Members, ReadBuffer]:
+        values = self.fmtstruct.unpack_from(buffer.data)
+        members = self.update_from(members, values)
+        return members, buffer.advance(self.fmtstruct.size)
+
+    def update_from(self, members: Members, values: tuple[Any, ...]) -> Members:
+        """Fill members from the values of one unpacked struct"""
+        if self.slices is None:
+            for fname, outtype, value in zip(
+                self.fnames, self.outtypes, values, strict=True
+            ):
+                members[fname] = outtype(value)
+            return members
+        for fname, outtype, valueslice in zip(
+            self.fnames, self.outtypes, self.slices, strict=True
+        ):
+            members[fname] = outtype(*values[valueslice])
+        return members
+
+
+_ORDERLESS_CODES = frozenset("0123456789bBcs?")
+"""Format characters whose size and value do not depend on byte order or alignment"""
+
+
+def _fusable_fmt(reader: ReadMembersMethod) -> tuple[str, str, int] | None:
+    """Split the format of a reader into (byte order, codes, number of values)
+
+    Returns None if the reader cannot be fused. Formats with an explicit
+    byte order have no alignment padding and can be concatenated with others
+    of the same order. Formats without one can only be fused if they consist
+    of single-byte codes, in which case the byte order is returned as "".
+    """
+    if not isinstance(reader, _FmtReader) or reader.fmtstruct is None:
+        return None
+    order, codes = reader.fmt[:1], reader.fmt[1:]
+    if order not in "<>!=":
+        order, codes = "", reader.fmt.removeprefix("@")
+        if not set(codes) <= _ORDERLESS_CODES:
+            return None
+    nvalues = len(reader.fmtstruct.unpack(bytes(reader.fmtstruct.size)))
+    return order, codes, nvalues
+
+
+def _fuse_fmt_readers(readers: list[ReadMembersMethod]) -> list[ReadMembersMethod]:
+    """Replace runs of adjacent fusable _FmtReader objects with a _FusedFmtReader"""
+    out: list[ReadMembersMethod] = []
+    run: list[tuple[_FmtReader, str, int]] = []
+    order = ""
+
+    def flush() -> None:
+        if len(run) == 1:
+            out.append(run[0][0])
+        elif run:
+            slices: list[slice] = []
+            start = 0
+            for _, _, nvalues in run:
+                slices.append(slice(start, start + nvalues))
+                start += nvalues
+            out.append(
+                _FusedFmtReader(
+                    tuple(reader.fname for reader, _, _ in run),
+                    tuple(reader.outtype for reader, _, _ in run),
+                    struct.Struct(
+                        (order or "=") + "".join(codes for _, codes, _ in run)
+                    ),
+                    None
+                    if all(nvalues == 1 for _, _, nvalues in run)
+                    else tuple(slices),
+                )
+            )
+        run.clear()
+
+    for reader in readers:
+        fusable = _fusable_fmt(reader)
+        if fusable is None:
+            flush()
+            out.append(reader)
+            continue
+        if run and fusable[0] and order and fusable[0] != order:
+            flush()
+        if not run:
+            order = ""
+        order = order or fusable[0]
+        run.append((reader, fusable[1], fusable[2]))  # type: ignore[arg-type]
+    flush()
+    return out
 
 
 @dataclasses.dataclass
@@ -32,45 +155,41 @@ class Fmt(MemberSerDe):
         return _FmtReader(fname, self.fmt, ftype)
 
 
-@dataclasses.dataclass
+_OPTIONAL_FIELD_OPS: dict[str, Callable[[Any, Any], Any]] = {
+    "&": operator.and_,
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+"""Operations that can be used to test the flag of an OptionalField"""
+
+
+@dataclasses.dataclass(slots=True)
 class _OptionalFieldReader:
     """A class to read an optional field from a buffer."""
 
     fname: str
-    fmt: str
     flagname: str
-    operation: str
+    op_func: Callable[[Any, Any], Any]
     flagvalue: int
     ftype: type
+    fmtstruct: struct.Struct | None
+    """The precompiled format of the field, or None if ftype is read as a class"""
 
     def __call__(
         self, members: Members, buffer: ReadBuffer
     ) -> tuple[Members, ReadBuffer]:
-        flag = members[self.flagname]
-        ops = {
-            "&": lambda a, b: a & b,
-            "==": operator.eq,
-            "!=": operator.ne,
-            ">=": operator.ge,
-            "<=": operator.le,
-            ">": operator.gt,
-            "<": operator.lt,
-        }
-        op_func = ops.get(self.operation)
-        if op_func is None:
-            msg = f"Unsupported operation: {self.operation}. Supported operations: {', '.join(ops.keys())}"
-            raise ValueError(msg)
-        if op_func(flag, self.flagvalue):
-            if self.fmt == "class":
-                if not issubclass(self.ftype, ROOTSerializable):
-                    msg = f"Expected ftype to be a subclass of ROOTSerializable, got {self.ftype}"
-                    raise TypeError(msg)
-                members[self.fname], buffer = self.ftype.read(buffer)
-            else:
-                tup, buffer = buffer.unpack(self.fmt)
-                members[self.fname] = self.ftype(*tup)
-        else:
+        if not self.op_func(members[self.flagname], self.flagvalue):
             members[self.fname] = None
+        elif self.fmtstruct is None:
+            members[self.fname], buffer = self.ftype.read(buffer)  # type: ignore[attr-defined]
+        else:
+            tup = self.fmtstruct.unpack_from(buffer.data)
+            members[self.fname] = self.ftype(*tup)
+            buffer = buffer.advance(self.fmtstruct.size)
         return members, buffer
 
 
@@ -88,8 +207,21 @@ class OptionalField(MemberSerDe):
 
     def build_reader(self, fname: str, ftype: type):
         ftype, _ = get_args(ftype)  # Get the type inside Optional
+        op_func = _OPTIONAL_FIELD_OPS.get(self.operation)
+        if op_func is None:
+            msg = f"Unsupported operation: {self.operation}. Supported operations: {', '.join(_OPTIONAL_FIELD_OPS)}"
+            raise ValueError(msg)
+        fmtstruct = None
+        if self.fmt == "class":
+            if not issubclass(ftype, ROOTSerializable):
+                msg = (
+                    f"Expected ftype to be a subclass of ROOTSerializable, got {ftype}"
+                )
+                raise TypeError(msg)
+        else:
+            fmtstruct = struct.Struct(self.fmt)
         return _OptionalFieldReader(
-            fname, self.fmt, self.flagname, self.operation, self.flagvalue, ftype
+            fname, self.flagname, op_func, self.flagvalue, ftype, fmtstruct
         )
 
 
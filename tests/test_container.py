@@ -0,0 +1,139 @@
+import dataclasses
+import struct
+from typing import Annotated
+
+import numpy as np
+import pytest
+
+from rootfilespec.bootstrap import BOOTSTRAP_CONTEXT
+from rootfilespec.container import (
+    BasicArray,
+    CArray,
+    FixedSizeArray,
+    StdMap,
+    StdSet,
+    StdVector,
+    _item_dtype,
+)
+from rootfilespec.serializable import (
+    BufferContext,
+    MemberSerDe,
+    ReadBuffer,
+    ROOTSerializable,
+    _build_read,
+    serializable,
+)
+from rootfilespec.structutil import Fmt
+
+VALUES = [1, -2, 3_000_000, -4]
+KEYS = [3, -1, 2]
+FLOATS = [0.5, -1.0, 2.25]
+
+_KEY_READER = _build_read(Annotated[int, Fmt(">i")])  # type: ignore[arg-type]
+_VALUE_READER = _build_read(Annotated[float, Fmt(">d")])  # type: ignore[arg-type]
+
+
+@serializable
+class _Point(ROOTSerializable):
+    x: Annotated[int, Fmt(">i")]
+    y: Annotated[float, Fmt(">d")]
+
+
+def _buffer(data: bytes) -> ReadBuffer:
+    return ReadBuffer(memoryview(data), 0, BOOTSTRAP_CONTEXT, BufferContext(None))
+
+
+def _stl_header(memberwise: bool = False) -> bytes:
+    """A version 9 StreamHeader, as written in front of STL collections"""
+    return struct.pack(">iH", 0x40000000, 9 | (0x4000 if memberwise else 0))
+
+
+@pytest.mark.parametrize(
+    ("serde", "members", "prefix"),
+    [
+        (BasicArray(">i", "n"), {"n": len(VALUES)}, b"\x01"),
+        (CArray(">i"), {}, struct.pack(">i", len(VALUES))),
+        (FixedSizeArray(">i", len(VALUES)), {}, b""),
+    ],
+)
+def test_native_array(
+    serde: BasicArray | CArray | FixedSizeArray, members: dict[str, int], prefix: bytes
+):
+    data = prefix + struct.pack(f">{len(VALUES)}i", *VALUES)
+
+    def read(serde: MemberSerDe) -> np.ndarray:
+        reader = serde.build_reader("arr", np.ndarray)
+        out, buffer = reader(dict(members), _buffer(data))
+        assert not buffer
+        arr: np.ndarray = out["arr"]
+        return arr
+
+    filearr = read(serde)
+    assert filearr.dtype == np.dtype(">i4")
+    assert filearr.tolist() == VALUES
+
+    native = read(dataclasses.replace(serde, native=True))
+    assert native.dtype.isnative
+    assert native.dtype == np.dtype("i4")
+    assert native.tolist() == VALUES
+
+
+def test_std_set_bulk():
+    data = _stl_header() + struct.pack(f">i{len(KEYS)}i", len(KEYS), *KEYS)
+
+    bulk, buffer = StdSet.read_as(_KEY_READER, _buffer(data), _item_dtype(_KEY_READER))
+    assert not buffer
+    peritem, buffer = StdSet.read_as(_KEY_READER, _buffer(data))
+    assert not buffer
+
+    assert bulk == peritem == StdSet(set(KEYS))
+    assert all(type(item) is int for item in bulk.items)
+
+
+@pytest.mark.parametrize("memberwise", [False, True])
+def test_std_map_bulk(memberwise: bool):
+    n = len(KEYS)
+    if memberwise:
+        # member version and checksum, then all keys followed by all values
+        data = (
+            _stl_header(memberwise=True)
+            + struct.pack(">hIi", 0, 0, n)
+            + struct.pack(f">{n}i", *KEYS)
+            + struct.pack(f">{n}d", *FLOATS)
+        )
+    else:
+        data = _stl_header() + struct.pack(">i", n)
+        data += b"".join(
+            struct.pack(">id", k, v) for k, v in zip(KEYS, FLOATS, strict=True)
+        )
+
+    bulk, buffer = StdMap.read_as(
+        _KEY_READER,
+        _VALUE_READER,
+        _buffer(data),
+        _item_dtype(_KEY_READER),
+        _item_dtype(_VALUE_READER),
+    )
+    assert not buffer
+    peritem, buffer = StdMap.read_as(_KEY_READER, _VALUE_READER, _buffer(data))
+    assert not buffer
+
+    assert bulk == peritem == StdMap(dict(zip(KEYS, FLOATS, strict=True)))
+    assert all(type(k) is int and type(v) is float for k, v in bulk.items.items())
+
+
+def test_std_vector_records_bulk():
+    data = _stl_header() + struct.pack(">i", len(KEYS))
+    data += b"".join(
+        struct.pack(">id", x, y) for x, y in zip(KEYS, FLOATS, strict=True)
+    )
+
+    reader = StdVector.build_reader("points", _build_read(_Point))
+    assert reader.itemrecord is not None
+    members, buffer = reader({}, _buffer(data))
+    assert not buffer
+    peritem, buffer = StdVector.read_as(reader.inner_reader, True, _buffer(data))
+    assert not buffer
+
+    assert members["points"] == peritem
+    assert peritem.items == [_Point(x, y) for x, y in zip(KEYS, FLOATS, strict=True)]
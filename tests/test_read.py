@@ -1,4 +1,6 @@
+import mmap
 from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import partial
 from pathlib import Path
@@ -8,12 +10,14 @@ import numpy as np
 import pytest
 from skhep_testdata import data_path, known_files  # type: ignore[import-not-found]
 
+from rootfilespec import __version__
 from rootfilespec.bootstrap import (
     BOOTSTRAP_CONTEXT,
     ROOT3a3aRNTuple,
     ROOTFile,
     TBasket,
     TDirectory,
+    TKey,
 )
 from rootfilespec.bootstrap.compression import decompress
 from rootfilespec.bootstrap.streamedobject import Ref, StreamHeader
@@ -93,7 +97,7 @@ class _ReadBasket:
             buffer, remaining = buffer[:item_end], buffer[item_end:]
             item, buffer = dyntype.read(buffer)
             if buffer:
-                msg = f"Expected buffer to be empty after reading {self.typename}, but got\n{buffer}"
+                msg = f"Expected buffer to be empty after reading {self.typename}, but got\n{buffer}\n{buffer.hexdump()}"
                 raise ValueError(msg)
             items.append(item)
             buffer = remaining
@@ -204,10 +208,17 @@ def _walk_branchlist(
             _ReadBasket(typename, basket.bheader.fNevBuf).read(buffer)
 
 
+def _read_key(
+    item: TKey, fetch_data: Callable[[Locator], ReadBuffer]
+) -> ROOTSerializable:
+    return item.read_from(fetch_data(item))
+
+
 def _walk(
     dir: TDirectory,
     fetch_data: Callable[[Locator], ReadBuffer],
     notimplemented_callback: Callable[[bytes, NotImplementedError], None],
+    executor: Executor | None = None,
     *,
     depth=0,
     maxdepth=-1,
@@ -225,11 +236,18 @@ def _walk(
         notimplemented_callback(path, ex)
         return
 
-    for item in keylist.values():
+    items = list(keylist.values())
+    # With an executor, sibling keys are fetched and read concurrently,
+    # but still handled in key order
+    futures = (
+        [executor.submit(_read_key, item, fetch_data) for item in items]
+        if executor
+        else None
+    )
+    for i, item in enumerate(items):
         itempath = path + item.fName.fString
-        buffer = fetch_data(item)
         try:
-            obj = item.read_from(buffer)
+            obj = futures[i].result() if futures else _read_key(item, fetch_data)
         except NotImplementedError as ex:
             notimplemented_callback(itempath, ex)
             continue
@@ -238,6 +256,7 @@ def _walk(
                 obj,
                 fetch_data,
                 notimplemented_callback,
+                executor,
                 depth=depth + 1,
                 path=itempath + b"/",
             )
@@ -264,12 +283,17 @@ def fetch_cached(buffer: ReadBuffer, loc: Locator[T_co]) -> T_co:
 def test_read_file(filename: str):
     path = Path(data_path(filename))
     with path.open("rb") as filehandle:
+        # Map the file once and serve every fetch as a view into it.
+        # The mapping is left to the garbage collector since views into it
+        # may be kept alive by the objects read from the file.
+        filedata = memoryview(
+            mmap.mmap(filehandle.fileno(), 0, access=mmap.ACCESS_READ)
+        )
 
         def fetch_buffer(loc: Locator):
             seek, size = loc.offset, loc.size
-            filehandle.seek(seek)
             return ReadBuffer(
-                memoryview(filehandle.read(size)),
+                filedata[seek : seek + size],
                 0,
                 BOOTSTRAP_CONTEXT,
                 BufferContext(abspos=seek),
@@ -319,9 +343,8 @@ def test_read_file(filename: str):
         def fetch_after_streamers(loc: Locator) -> ReadBuffer:
             seek, size = loc.offset, loc.size
             print(f"fetch_data {seek=} {size=}")
-            filehandle.seek(seek)
             return ReadBuffer(
-                memoryview(filehandle.read(size)),
+                filedata[seek : seek + size],
                 0,
                 file_context,
                 BufferContext(abspos=seek),
@@ -336,3 +359,83 @@ def test_read_file(filename: str):
             return pytest.xfail(reason=str(ex))
         finally:
             file_context.purge_module()
+
+
+def test_build_file_context_cache(tmp_path: Path):
+    path = Path(data_path("uproot-HZZ.root"))
+    filedata = memoryview(path.read_bytes())
+
+    def fetch_buffer(loc: Locator):
+        seek, size = loc.offset, loc.size
+        return ReadBuffer(
+            filedata[seek : seek + size],
+            0,
+            BOOTSTRAP_CONTEXT,
+            BufferContext(abspos=seek),
+        )
+
+    file, _ = ROOTFile.read(fetch_buffer(InitialReadLocator()))
+    assert file.streamerinfo_locator is not None
+    buffer = fetch_buffer(file.streamerinfo_locator)
+    streamerinfo = file.streamerinfo_locator.read_from(buffer).read_from(buffer)
+
+    # Make sure the module is not already loaded in this process
+    build_file_context(streamerinfo).purge_module()
+    build_file_context(streamerinfo, cache_dir=tmp_path).purge_module()
+    (cached,) = (tmp_path / __version__).glob("*.py")
+
+    # A second build must execute the cached source rather than render it again
+    cached.write_text(
+        cached.read_text(encoding="utf-8") + "\nFROM_CACHE = True\n", encoding="utf-8"
+    )
+    file_context = build_file_context(streamerinfo, cache_dir=tmp_path)
+    try:
+        assert file_context.module.FROM_CACHE
+    finally:
+        file_context.purge_module()
+
+
+def test_walk_executor():
+    path = Path(data_path("uproot-HZZ.root"))
+    filedata = memoryview(path.read_bytes())
+
+    def fetch_buffer(loc: Locator):
+        seek, size = loc.offset, loc.size
+        return ReadBuffer(
+            filedata[seek : seek + size],
+            0,
+            BOOTSTRAP_CONTEXT,
+            BufferContext(abspos=seek),
+        )
+
+    file, _ = ROOTFile.read(fetch_buffer(InitialReadLocator()))
+    tfile = partial(fetch_cached, fetch_buffer(InitialReadLocator()))
+    rootdir = tfile(tfile(file.tfile_locator)).rootdir
+    assert file.streamerinfo_locator is not None
+    buffer = fetch_buffer(file.streamerinfo_locator)
+    streamerinfo = file.streamerinfo_locator.read_from(buffer).read_from(buffer)
+    file_context = build_file_context(streamerinfo)
+
+    def walk(executor: Executor | None) -> tuple[list[tuple[int, int]], list[bytes]]:
+        fetched: list[tuple[int, int]] = []
+        failures: list[bytes] = []
+
+        def fetch_data(loc: Locator) -> ReadBuffer:
+            seek, size = loc.offset, loc.size
+            fetched.append((seek, size))
+            return ReadBuffer(
+                filedata[seek : seek + size],
+                0,
+                file_context,
+                BufferContext(abspos=seek),
+            )
+
+        _walk(rootdir, fetch_data, lambda path, _: failures.append(path), executor)
+        return sorted(fetched), failures
+
+    try:
+        with ThreadPoolExecutor() as executor:
+            # Reading concurrently must fetch the same data and fail the same way
+            assert walk(executor) == walk(None)
+    finally:
+        file_context.purge_module()
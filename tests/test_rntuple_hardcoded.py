@@ -1,15 +1,27 @@
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pytest
 from skhep_testdata import data_path  # type: ignore[import-not-found]
 
-from rootfilespec.bootstrap import BOOTSTRAP_CONTEXT, ROOT3a3aRNTuple, ROOTFile
+from rootfilespec.bootstrap import (
+    BOOTSTRAP_CONTEXT,
+    ROOT3a3aRNTuple,
+    ROOTFile,
+    TKeyList,
+)
 from rootfilespec.bootstrap.compression import RCompressionSettings
 from rootfilespec.bootstrap.strings import RString
 from rootfilespec.rntuple.envelope import REnvelopeLink, RFeatureFlags
 from rootfilespec.rntuple.footer import ClusterGroup, FooterEnvelope, SchemaExtension
 from rootfilespec.rntuple.header import HeaderEnvelope
 from rootfilespec.rntuple.pagelist import ClusterSummary, PageListEnvelope
-from rootfilespec.rntuple.pagelocations import PageLocations, RPageDescription
+from rootfilespec.rntuple.pagelocations import (
+    PageLocations,
+    RPageDescription,
+    get_pages,
+)
 from rootfilespec.rntuple.RFrame import ListFrame
 from rootfilespec.rntuple.RLocator import StandardLocator
 from rootfilespec.rntuple.RNTuple import InterpretablePage, RNTuple, SchemaDescription
@@ -18,262 +30,37 @@ from rootfilespec.rntuple.schema import (
     ColumnType,
     FieldDescription,
 )
-from rootfilespec.serializable import BufferContext, ReadBuffer
-
-# TODO: Add test for a more complex RNTuple with complex schema and multiple clusters
-
-
-def test_read_contributors():
-    filename = "rntviewer-testfile-uncomp-single-rntuple-v1-0-0-0.root"
-    path = Path(data_path(filename))
-    with path.open("rb") as filehandle:
-
-        def fetch_data(seek: int, size: int):
-            filehandle.seek(seek)
-            return ReadBuffer(
-                memoryview(filehandle.read(size)),
-                0,
-                BOOTSTRAP_CONTEXT,
-                BufferContext(abspos=seek),
-            )
-
-        def fetch_from_locator(loc):
-            return fetch_data(loc.offset, loc.size)
-
-        buffer = fetch_data(0, 512)
-        file, _ = ROOTFile.read(buffer)
-        tfile = file.get_TFile(fetch_data)
-        keylist = tfile.get_KeyList(fetch_data)
-        anchor = keylist["Contributors"].read_object(fetch_data, ROOT3a3aRNTuple)
-
-        assert anchor == ROOT3a3aRNTuple(
-            fVersionEpoch=1,
-            fVersionMajor=0,
-            fVersionMinor=0,
-            fVersionPatch=0,
-            fSeekHeader=254,
-            fNBytesHeader=332,
-            fLenHeader=332,
-            fSeekFooter=1687,
-            fNBytesFooter=148,
-            fLenFooter=148,
-            fMaxKeySize=1073741824,
-        )
+from rootfilespec.serializable import BufferContext, DataFetcher, ReadBuffer
 
-        rntuple = RNTuple.from_anchor(anchor, fetch_from_locator)
-        assert rntuple == RNTuple(
-            headerEnvelope=HeaderEnvelope(
-                typeID=1,
-                length=332,
-                checksum=9346497350689737328,
-                featureFlags=RFeatureFlags(flags=0),
-                fName=RString(fString=b"Contributors"),
-                fDescription=RString(fString=b"The first ever RNTuple."),
-                fLibrary=RString(fString=b"ROOT v6.35.001"),
-                fieldDescriptions=ListFrame(
-                    fSize=131,
-                    items=[
-                        FieldDescription(
-                            fSize=60,
-                            fFieldVersion=0,
-                            fTypeVersion=0,
-                            fParentFieldID=0,
-                            fStructuralRole=0,
-                            fFlags=0,
-                            fFieldName=RString(fString=b"firstName"),
-                            fTypeName=RString(fString=b"std::string"),
-                            fTypeAlias=RString(fString=b""),
-                            fFieldDescription=RString(fString=b""),
-                            fArraySize=None,
-                            fSourceFieldID=None,
-                            fTypeChecksum=None,
-                        ),
-                        FieldDescription(
-                            fSize=59,
-                            fFieldVersion=0,
-                            fTypeVersion=0,
-                            fParentFieldID=1,
-                            fStructuralRole=0,
-                            fFlags=0,
-                            fFieldName=RString(fString=b"lastName"),
-                            fTypeName=RString(fString=b"std::string"),
-                            fTypeAlias=RString(fString=b""),
-                            fFieldDescription=RString(fString=b""),
-                            fArraySize=None,
-                            fSourceFieldID=None,
-                            fTypeChecksum=None,
-                        ),
-                    ],
-                ),
-                columnDescriptions=ListFrame(
-                    fSize=92,
-                    items=[
-                        ColumnDescription(
-                            fSize=20,
-                            fColumnType=ColumnType.kIndex64,
-                            fBitsOnStorage=64,
-                            fFieldID=0,
-                            fFlags=0,
-                            fRepresentationIndex=0,
-                            fFirstElementIndex=None,
-                            fMinValue=None,
-                            fMaxValue=None,
-                        ),
-                        ColumnDescription(
-                            fSize=20,
-                            fColumnType=ColumnType.kChar,
-                            fBitsOnStorage=8,
-                            fFieldID=0,
-                            fFlags=0,
-                            fRepresentationIndex=0,
-                            fFirstElementIndex=None,
-                            fMinValue=None,
-                            fMaxValue=None,
-                        ),
-                        ColumnDescription(
-                            fSize=20,
-                            fColumnType=ColumnType.kIndex64,
-                            fBitsOnStorage=64,
-                            fFieldID=1,
-                            fFlags=0,
-                            fRepresentationIndex=0,
-                            fFirstElementIndex=None,
-                            fMinValue=None,
-                            fMaxValue=None,
-                        ),
-                        ColumnDescription(
-                            fSize=20,
-                            fColumnType=ColumnType.kChar,
-                            fBitsOnStorage=8,
-                            fFieldID=1,
-                            fFlags=0,
-                            fRepresentationIndex=0,
-                            fFirstElementIndex=None,
-                            fMinValue=None,
-                            fMaxValue=None,
-                        ),
-                    ],
-                ),
-                aliasColumnDescriptions=ListFrame(fSize=12, items=[]),
-                extraTypeInformations=ListFrame(fSize=12, items=[]),
-            ),
-            footerEnvelope=FooterEnvelope(
-                typeID=2,
-                length=148,
-                checksum=9038192899957947137,
-                featureFlags=RFeatureFlags(flags=0),
-                headerChecksum=9346497350689737328,
-                schemaExtension=SchemaExtension(
-                    fSize=56,
-                    fieldDescriptions=ListFrame(fSize=12, items=[]),
-                    columnDescriptions=ListFrame(fSize=12, items=[]),
-                    aliasColumnDescriptions=ListFrame(fSize=12, items=[]),
-                    extraTypeInformations=ListFrame(fSize=12, items=[]),
-                ),
-                clusterGroups=ListFrame(
-                    fSize=60,
-                    items=[
-                        ClusterGroup(
-                            fSize=48,
-                            fMinEntryNumber=0,
-                            fEntrySpan=22,
-                            fNClusters=1,
-                            pagelistLink=REnvelopeLink(
-                                length=244,
-                                locator=StandardLocator(size=244, offset=1409),
-                            ),
-                        )
-                    ],
-                ),
-            ),
-            pagelistEnvelopes=[
-                PageListEnvelope(
-                    typeID=3,
-                    length=244,
-                    checksum=12340257838343085244,
-                    headerChecksum=9346497350689737328,
-                    clusterSummaries=ListFrame(
-                        fSize=36,
-                        items=[
-                            ClusterSummary(
-                                fSize=24,
-                                fFirstEntryNumber=0,
-                                fNEntriesAndFeatureFlag=22,
-                            )
-                        ],
-                    ),
-                    pageLocations=ListFrame(
-                        fSize=184,
-                        items=[
-                            ListFrame(
-                                fSize=172,
-                                items=[
-                                    PageLocations(
-                                        fSize=40,
-                                        items=[
-                                            RPageDescription(
-                                                fNElements=-22,
-                                                locator=StandardLocator(
-                                                    size=176, offset=620
-                                                ),
-                                            )
-                                        ],
-                                        elementoffset=0,
-                                        compressionsettings=RCompressionSettings(0),
-                                    ),
-                                    PageLocations(
-                                        fSize=40,
-                                        items=[
-                                            RPageDescription(
-                                                fNElements=-178,
-                                                locator=StandardLocator(
-                                                    size=178, offset=804
-                                                ),
-                                            )
-                                        ],
-                                        elementoffset=0,
-                                        compressionsettings=RCompressionSettings(0),
-                                    ),
-                                    PageLocations(
-                                        fSize=40,
-                                        items=[
-                                            RPageDescription(
-                                                fNElements=-22,
-                                                locator=StandardLocator(
-                                                    size=176, offset=990
-                                                ),
-                                            )
-                                        ],
-                                        elementoffset=0,
-                                        compressionsettings=RCompressionSettings(0),
-                                    ),
-                                    PageLocations(
-                                        fSize=40,
-                                        items=[
-                                            RPageDescription(
-                                                fNElements=-193,
-                                                locator=StandardLocator(
-                                                    size=193, offset=1174
-                                                ),
-                                            )
-                                        ],
-                                        elementoffset=0,
-                                        compressionsettings=RCompressionSettings(0),
-                                    ),
-                                ],
-                            )
-                        ],
-                    ),
-                )
-            ],
-        )
+# None of the test files sets any feature flag
+NO_FEATURE_FLAGS = RFeatureFlags(flags=0)
 
-        featureFlags = rntuple.featureFlags
-        assert featureFlags == RFeatureFlags(flags=0)
+CONTRIBUTORS_ANCHOR = ROOT3a3aRNTuple(
+    fVersionEpoch=1,
+    fVersionMajor=0,
+    fVersionMinor=0,
+    fVersionPatch=0,
+    fSeekHeader=254,
+    fNBytesHeader=332,
+    fLenHeader=332,
+    fSeekFooter=1687,
+    fNBytesFooter=148,
+    fLenFooter=148,
+    fMaxKeySize=1073741824,
+)
 
-        schemaDescription = rntuple.schemaDescription
-        assert schemaDescription == SchemaDescription(
-            fieldDescriptions=[
+CONTRIBUTORS_RNTUPLE = RNTuple(
+    headerEnvelope=HeaderEnvelope(
+        typeID=1,
+        length=332,
+        checksum=9346497350689737328,
+        featureFlags=RFeatureFlags(flags=0),
+        fName=RString(fString=b"Contributors"),
+        fDescription=RString(fString=b"The first ever RNTuple."),
+        fLibrary=RString(fString=b"ROOT v6.35.001"),
+        fieldDescriptions=ListFrame(
+            fSize=131,
+            items=[
                 FieldDescription(
                     fSize=60,
                     fFieldVersion=0,
@@ -305,7 +92,10 @@ def test_read_contributors():
                     fTypeChecksum=None,
                 ),
             ],
-            columnDescriptions=[
+        ),
+        columnDescriptions=ListFrame(
+            fSize=92,
+            items=[
                 ColumnDescription(
                     fSize=20,
                     fColumnType=ColumnType.kIndex64,
@@ -351,223 +141,269 @@ def test_read_contributors():
                     fMaxValue=None,
                 ),
             ],
-            aliasColumnDescriptions=[],
-            extraTypeInformations=[],
-        )
-
-        extended_page_descriptions = rntuple.get_extended_page_descriptions()
-        assert extended_page_descriptions == [  # PagelistEnvelopes
-            [  # Clusters (columnlists)
-                [  # Columns (pagelists)
-                    [  # Pages (page descriptions)
-                        InterpretablePage(
-                            pageDescription=RPageDescription(
-                                fNElements=-22,
-                                locator=StandardLocator(size=176, offset=620),
-                            ),
-                            uncompressedSize=176,
-                            columnType=ColumnType.kIndex64,
-                        )
-                    ],
-                    [
-                        InterpretablePage(
-                            pageDescription=RPageDescription(
-                                fNElements=-178,
-                                locator=StandardLocator(size=178, offset=804),
-                            ),
-                            uncompressedSize=178,
-                            columnType=ColumnType.kChar,
-                        )
-                    ],
-                    [
-                        InterpretablePage(
-                            pageDescription=RPageDescription(
-                                fNElements=-22,
-                                locator=StandardLocator(size=176, offset=990),
+        ),
+        aliasColumnDescriptions=ListFrame(fSize=12, items=[]),
+        extraTypeInformations=ListFrame(fSize=12, items=[]),
+    ),
+    footerEnvelope=FooterEnvelope(
+        typeID=2,
+        length=148,
+        checksum=9038192899957947137,
+        featureFlags=RFeatureFlags(flags=0),
+        headerChecksum=9346497350689737328,
+        schemaExtension=SchemaExtension(
+            fSize=56,
+            fieldDescriptions=ListFrame(fSize=12, items=[]),
+            columnDescriptions=ListFrame(fSize=12, items=[]),
+            aliasColumnDescriptions=ListFrame(fSize=12, items=[]),
+            extraTypeInformations=ListFrame(fSize=12, items=[]),
+        ),
+        clusterGroups=ListFrame(
+            fSize=60,
+            items=[
+                ClusterGroup(
+                    fSize=48,
+                    fMinEntryNumber=0,
+                    fEntrySpan=22,
+                    fNClusters=1,
+                    pagelistLink=REnvelopeLink(
+                        length=244,
+                        locator=StandardLocator(size=244, offset=1409),
+                    ),
+                )
+            ],
+        ),
+    ),
+    pagelistEnvelopes=[
+        PageListEnvelope(
+            typeID=3,
+            length=244,
+            checksum=12340257838343085244,
+            headerChecksum=9346497350689737328,
+            clusterSummaries=ListFrame(
+                fSize=36,
+                items=[
+                    ClusterSummary(
+                        fSize=24,
+                        fFirstEntryNumber=0,
+                        fNEntriesAndFeatureFlag=22,
+                    )
+                ],
+            ),
+            pageLocations=ListFrame(
+                fSize=184,
+                items=[
+                    ListFrame(
+                        fSize=172,
+                        items=[
+                            PageLocations(
+                                fSize=40,
+                                items=[
+                                    RPageDescription(
+                                        fNElements=-22,
+                                        locator=StandardLocator(size=176, offset=620),
+                                    )
+                                ],
+                                elementoffset=0,
+                                compressionsettings=RCompressionSettings(0),
                             ),
-                            uncompressedSize=176,
-                            columnType=ColumnType.kIndex64,
-                        )
-                    ],
-                    [
-                        InterpretablePage(
-                            pageDescription=RPageDescription(
-                                fNElements=-193,
-                                locator=StandardLocator(size=193, offset=1174),
+                            PageLocations(
+                                fSize=40,
+                                items=[
+                                    RPageDescription(
+                                        fNElements=-178,
+                                        locator=StandardLocator(size=178, offset=804),
+                                    )
+                                ],
+                                elementoffset=0,
+                                compressionsettings=RCompressionSettings(0),
                             ),
-                            uncompressedSize=193,
-                            columnType=ColumnType.kChar,
-                        )
-                    ],
-                ]
-            ]
-        ]
-
-
-def test_read_multiple_rntuples():
-    filename = "rntviewer-testfile-multiple-rntuples-v1-0-0-0.root"
-    path = Path(data_path(filename))
-    with path.open("rb") as filehandle:
-
-        def fetch_data(seek: int, size: int):
-            filehandle.seek(seek)
-            return ReadBuffer(
-                memoryview(filehandle.read(size)),
-                0,
-                BOOTSTRAP_CONTEXT,
-                BufferContext(abspos=seek),
-            )
-
-        def fetch_from_locator(loc):
-            return fetch_data(loc.offset, loc.size)
-
-        buffer = fetch_data(0, 512)
-        file, _ = ROOTFile.read(buffer)
-        tfile = file.get_TFile(fetch_data)
-        keylist = tfile.get_KeyList(fetch_data)
-
-        anchor_a = keylist["A"].read_object(fetch_data, ROOT3a3aRNTuple)
-        assert anchor_a == ROOT3a3aRNTuple(
-            fVersionEpoch=1,
-            fVersionMajor=0,
-            fVersionMinor=0,
-            fVersionPatch=0,
-            fSeekHeader=266,
-            fNBytesHeader=101,
-            fLenHeader=164,
-            fSeekFooter=725,
-            fNBytesFooter=82,
-            fLenFooter=148,
-            fMaxKeySize=1073741824,
-        )
-
-        rntuple_a = RNTuple.from_anchor(anchor_a, fetch_from_locator)
-        assert rntuple_a == RNTuple(
-            headerEnvelope=HeaderEnvelope(
-                typeID=1,
-                length=164,
-                checksum=1772847515747675522,
-                featureFlags=RFeatureFlags(flags=0),
-                fName=RString(fString=b"A"),
-                fDescription=RString(fString=b""),
-                fLibrary=RString(fString=b"ROOT v6.35.01"),
-                fieldDescriptions=ListFrame(
-                    fSize=58,
-                    items=[
-                        FieldDescription(
-                            fSize=46,
-                            fFieldVersion=0,
-                            fTypeVersion=0,
-                            fParentFieldID=0,
-                            fStructuralRole=0,
-                            fFlags=0,
-                            fFieldName=RString(fString=b"f"),
-                            fTypeName=RString(fString=b"float"),
-                            fTypeAlias=RString(fString=b""),
-                            fFieldDescription=RString(fString=b""),
-                            fArraySize=None,
-                            fSourceFieldID=None,
-                            fTypeChecksum=None,
-                        )
-                    ],
-                ),
-                columnDescriptions=ListFrame(
-                    fSize=32,
-                    items=[
-                        ColumnDescription(
-                            fSize=20,
-                            fColumnType=ColumnType.kSplitReal32,
-                            fBitsOnStorage=32,
-                            fFieldID=0,
-                            fFlags=0,
-                            fRepresentationIndex=0,
-                            fFirstElementIndex=None,
-                            fMinValue=None,
-                            fMaxValue=None,
-                        )
-                    ],
-                ),
-                aliasColumnDescriptions=ListFrame(fSize=12, items=[]),
-                extraTypeInformations=ListFrame(fSize=12, items=[]),
-            ),
-            footerEnvelope=FooterEnvelope(
-                typeID=2,
-                length=148,
-                checksum=16904131729352343975,
-                featureFlags=RFeatureFlags(flags=0),
-                headerChecksum=1772847515747675522,
-                schemaExtension=SchemaExtension(
-                    fSize=56,
-                    fieldDescriptions=ListFrame(fSize=12, items=[]),
-                    columnDescriptions=ListFrame(fSize=12, items=[]),
-                    aliasColumnDescriptions=ListFrame(fSize=12, items=[]),
-                    extraTypeInformations=ListFrame(fSize=12, items=[]),
-                ),
-                clusterGroups=ListFrame(
-                    fSize=60,
-                    items=[
-                        ClusterGroup(
-                            fSize=48,
-                            fMinEntryNumber=0,
-                            fEntrySpan=100,
-                            fNClusters=1,
-                            pagelistLink=REnvelopeLink(
-                                length=124,
-                                locator=StandardLocator(size=86, offset=597),
+                            PageLocations(
+                                fSize=40,
+                                items=[
+                                    RPageDescription(
+                                        fNElements=-22,
+                                        locator=StandardLocator(size=176, offset=990),
+                                    )
+                                ],
+                                elementoffset=0,
+                                compressionsettings=RCompressionSettings(0),
                             ),
-                        )
-                    ],
-                ),
-            ),
-            pagelistEnvelopes=[
-                PageListEnvelope(
-                    typeID=3,
-                    length=124,
-                    checksum=748677678342101309,
-                    headerChecksum=1772847515747675522,
-                    clusterSummaries=ListFrame(
-                        fSize=36,
-                        items=[
-                            ClusterSummary(
-                                fSize=24,
-                                fFirstEntryNumber=0,
-                                fNEntriesAndFeatureFlag=100,
-                            )
-                        ],
-                    ),
-                    pageLocations=ListFrame(
-                        fSize=64,
-                        items=[
-                            ListFrame(
-                                fSize=52,
+                            PageLocations(
+                                fSize=40,
                                 items=[
-                                    PageLocations(
-                                        fSize=40,
-                                        items=[
-                                            RPageDescription(
-                                                fNElements=-100,
-                                                locator=StandardLocator(
-                                                    size=138, offset=409
-                                                ),
-                                            )
-                                        ],
-                                        elementoffset=0,
-                                        compressionsettings=RCompressionSettings(505),
+                                    RPageDescription(
+                                        fNElements=-193,
+                                        locator=StandardLocator(size=193, offset=1174),
                                     )
                                 ],
-                            )
+                                elementoffset=0,
+                                compressionsettings=RCompressionSettings(0),
+                            ),
                         ],
+                    )
+                ],
+            ),
+        )
+    ],
+)
+
+CONTRIBUTORS_SCHEMA_DESCRIPTION = SchemaDescription(
+    fieldDescriptions=[
+        FieldDescription(
+            fSize=60,
+            fFieldVersion=0,
+            fTypeVersion=0,
+            fParentFieldID=0,
+            fStructuralRole=0,
+            fFlags=0,
+            fFieldName=RString(fString=b"firstName"),
+            fTypeName=RString(fString=b"std::string"),
+            fTypeAlias=RString(fString=b""),
+            fFieldDescription=RString(fString=b""),
+            fArraySize=None,
+            fSourceFieldID=None,
+            fTypeChecksum=None,
+        ),
+        FieldDescription(
+            fSize=59,
+            fFieldVersion=0,
+            fTypeVersion=0,
+            fParentFieldID=1,
+            fStructuralRole=0,
+            fFlags=0,
+            fFieldName=RString(fString=b"lastName"),
+            fTypeName=RString(fString=b"std::string"),
+            fTypeAlias=RString(fString=b""),
+            fFieldDescription=RString(fString=b""),
+            fArraySize=None,
+            fSourceFieldID=None,
+            fTypeChecksum=None,
+        ),
+    ],
+    columnDescriptions=[
+        ColumnDescription(
+            fSize=20,
+            fColumnType=ColumnType.kIndex64,
+            fBitsOnStorage=64,
+            fFieldID=0,
+            fFlags=0,
+            fRepresentationIndex=0,
+            fFirstElementIndex=None,
+            fMinValue=None,
+            fMaxValue=None,
+        ),
+        ColumnDescription(
+            fSize=20,
+            fColumnType=ColumnType.kChar,
+            fBitsOnStorage=8,
+            fFieldID=0,
+            fFlags=0,
+            fRepresentationIndex=0,
+            fFirstElementIndex=None,
+            fMinValue=None,
+            fMaxValue=None,
+        ),
+        ColumnDescription(
+            fSize=20,
+            fColumnType=ColumnType.kIndex64,
+            fBitsOnStorage=64,
+            fFieldID=1,
+            fFlags=0,
+            fRepresentationIndex=0,
+            fFirstElementIndex=None,
+            fMinValue=None,
+            fMaxValue=None,
+        ),
+        ColumnDescription(
+            fSize=20,
+            fColumnType=ColumnType.kChar,
+            fBitsOnStorage=8,
+            fFieldID=1,
+            fFlags=0,
+            fRepresentationIndex=0,
+            fFirstElementIndex=None,
+            fMinValue=None,
+            fMaxValue=None,
+        ),
+    ],
+    aliasColumnDescriptions=[],
+    extraTypeInformations=[],
+)
+
+CONTRIBUTORS_PAGE_DESCRIPTIONS = [  # PagelistEnvelopes
+    [  # Clusters (columnlists)
+        [  # Columns (pagelists)
+            [  # Pages (page descriptions)
+                InterpretablePage(
+                    pageDescription=RPageDescription(
+                        fNElements=-22,
+                        locator=StandardLocator(size=176, offset=620),
                     ),
+                    uncompressedSize=176,
+                    columnType=ColumnType.kIndex64,
                 )
             ],
-        )
+            [
+                InterpretablePage(
+                    pageDescription=RPageDescription(
+                        fNElements=-178,
+                        locator=StandardLocator(size=178, offset=804),
+                    ),
+                    uncompressedSize=178,
+                    columnType=ColumnType.kChar,
+                )
+            ],
+            [
+                InterpretablePage(
+                    pageDescription=RPageDescription(
+                        fNElements=-22,
+                        locator=StandardLocator(size=176, offset=990),
+                    ),
+                    uncompressedSize=176,
+                    columnType=ColumnType.kIndex64,
+                )
+            ],
+            [
+                InterpretablePage(
+                    pageDescription=RPageDescription(
+                        fNElements=-193,
+                        locator=StandardLocator(size=193, offset=1174),
+                    ),
+                    uncompressedSize=193,
+                    columnType=ColumnType.kChar,
+                )
+            ],
+        ]
+    ]
+]
 
-        featureFlags_a = rntuple_a.featureFlags
-        assert featureFlags_a == RFeatureFlags(flags=0)
+MULTIPLE_A_ANCHOR = ROOT3a3aRNTuple(
+    fVersionEpoch=1,
+    fVersionMajor=0,
+    fVersionMinor=0,
+    fVersionPatch=0,
+    fSeekHeader=266,
+    fNBytesHeader=101,
+    fLenHeader=164,
+    fSeekFooter=725,
+    fNBytesFooter=82,
+    fLenFooter=148,
+    fMaxKeySize=1073741824,
+)
 
-        schemaDescription_a = rntuple_a.schemaDescription
-        assert schemaDescription_a == SchemaDescription(
-            fieldDescriptions=[
+MULTIPLE_A_RNTUPLE = RNTuple(
+    headerEnvelope=HeaderEnvelope(
+        typeID=1,
+        length=164,
+        checksum=1772847515747675522,
+        featureFlags=RFeatureFlags(flags=0),
+        fName=RString(fString=b"A"),
+        fDescription=RString(fString=b""),
+        fLibrary=RString(fString=b"ROOT v6.35.01"),
+        fieldDescriptions=ListFrame(
+            fSize=58,
+            items=[
                 FieldDescription(
                     fSize=46,
                     fFieldVersion=0,
@@ -584,7 +420,10 @@ def test_read_multiple_rntuples():
                     fTypeChecksum=None,
                 )
             ],
-            columnDescriptions=[
+        ),
+        columnDescriptions=ListFrame(
+            fSize=32,
+            items=[
                 ColumnDescription(
                     fSize=20,
                     fColumnType=ColumnType.kSplitReal32,
@@ -597,170 +436,158 @@ def test_read_multiple_rntuples():
                     fMaxValue=None,
                 )
             ],
-            aliasColumnDescriptions=[],
-            extraTypeInformations=[],
-        )
-
-        extended_page_descriptions_a = rntuple_a.get_extended_page_descriptions()
-        assert extended_page_descriptions_a == [  # PagelistEnvelopes
-            [  # Clusters (columnlists)
-                [  # Columns (pagelists)
-                    [  # Pages (page descriptions)
-                        InterpretablePage(
-                            pageDescription=RPageDescription(
-                                fNElements=-100,
-                                locator=StandardLocator(size=138, offset=409),
-                            ),
-                            uncompressedSize=400,
-                            columnType=ColumnType.kSplitReal32,
-                        )
-                    ]
-                ]
-            ]
-        ]
-
-        anchor_b = keylist["B"].read_object(fetch_data, ROOT3a3aRNTuple)
-        assert anchor_b == ROOT3a3aRNTuple(
-            fVersionEpoch=1,
-            fVersionMajor=0,
-            fVersionMinor=0,
-            fVersionPatch=0,
-            fSeekHeader=1542,
-            fNBytesHeader=111,
-            fLenHeader=171,
-            fSeekFooter=2037,
-            fNBytesFooter=82,
-            fLenFooter=148,
-            fMaxKeySize=1073741824,
-        )
-
-        rntuple_b = RNTuple.from_anchor(anchor_b, fetch_from_locator)
-        assert rntuple_b == RNTuple(
-            headerEnvelope=HeaderEnvelope(
-                typeID=1,
-                length=171,
-                checksum=14068653553654343426,
-                featureFlags=RFeatureFlags(flags=0),
-                fName=RString(fString=b"B"),
-                fDescription=RString(fString=b""),
-                fLibrary=RString(fString=b"ROOT v6.35.01"),
-                fieldDescriptions=ListFrame(
-                    fSize=65,
-                    items=[
-                        FieldDescription(
-                            fSize=53,
-                            fFieldVersion=0,
-                            fTypeVersion=0,
-                            fParentFieldID=0,
-                            fStructuralRole=0,
-                            fFlags=0,
-                            fFieldName=RString(fString=b"g"),
-                            fTypeName=RString(fString=b"std::int32_t"),
-                            fTypeAlias=RString(fString=b""),
-                            fFieldDescription=RString(fString=b""),
-                            fArraySize=None,
-                            fSourceFieldID=None,
-                            fTypeChecksum=None,
-                        )
-                    ],
-                ),
-                columnDescriptions=ListFrame(
-                    fSize=32,
-                    items=[
-                        ColumnDescription(
-                            fSize=20,
-                            fColumnType=ColumnType.kSplitInt32,
-                            fBitsOnStorage=32,
-                            fFieldID=0,
-                            fFlags=0,
-                            fRepresentationIndex=0,
-                            fFirstElementIndex=None,
-                            fMinValue=None,
-                            fMaxValue=None,
-                        )
-                    ],
-                ),
-                aliasColumnDescriptions=ListFrame(fSize=12, items=[]),
-                extraTypeInformations=ListFrame(fSize=12, items=[]),
-            ),
-            footerEnvelope=FooterEnvelope(
-                typeID=2,
-                length=148,
-                checksum=17038928962946065552,
-                featureFlags=RFeatureFlags(flags=0),
-                headerChecksum=14068653553654343426,
-                schemaExtension=SchemaExtension(
-                    fSize=56,
-                    fieldDescriptions=ListFrame(fSize=12, items=[]),
-                    columnDescriptions=ListFrame(fSize=12, items=[]),
-                    aliasColumnDescriptions=ListFrame(fSize=12, items=[]),
-                    extraTypeInformations=ListFrame(fSize=12, items=[]),
-                ),
-                clusterGroups=ListFrame(
-                    fSize=60,
-                    items=[
-                        ClusterGroup(
-                            fSize=48,
-                            fMinEntryNumber=0,
-                            fEntrySpan=100,
-                            fNClusters=1,
-                            pagelistLink=REnvelopeLink(
-                                length=124,
-                                locator=StandardLocator(size=86, offset=1909),
-                            ),
-                        )
-                    ],
-                ),
-            ),
-            pagelistEnvelopes=[
-                PageListEnvelope(
-                    typeID=3,
-                    length=124,
-                    checksum=674435399773528910,
-                    headerChecksum=14068653553654343426,
-                    clusterSummaries=ListFrame(
-                        fSize=36,
-                        items=[
-                            ClusterSummary(
-                                fSize=24,
-                                fFirstEntryNumber=0,
-                                fNEntriesAndFeatureFlag=100,
-                            )
-                        ],
+        ),
+        aliasColumnDescriptions=ListFrame(fSize=12, items=[]),
+        extraTypeInformations=ListFrame(fSize=12, items=[]),
+    ),
+    footerEnvelope=FooterEnvelope(
+        typeID=2,
+        length=148,
+        checksum=16904131729352343975,
+        featureFlags=RFeatureFlags(flags=0),
+        headerChecksum=1772847515747675522,
+        schemaExtension=SchemaExtension(
+            fSize=56,
+            fieldDescriptions=ListFrame(fSize=12, items=[]),
+            columnDescriptions=ListFrame(fSize=12, items=[]),
+            aliasColumnDescriptions=ListFrame(fSize=12, items=[]),
+            extraTypeInformations=ListFrame(fSize=12, items=[]),
+        ),
+        clusterGroups=ListFrame(
+            fSize=60,
+            items=[
+                ClusterGroup(
+                    fSize=48,
+                    fMinEntryNumber=0,
+                    fEntrySpan=100,
+                    fNClusters=1,
+                    pagelistLink=REnvelopeLink(
+                        length=124,
+                        locator=StandardLocator(size=86, offset=597),
                     ),
-                    pageLocations=ListFrame(
-                        fSize=64,
+                )
+            ],
+        ),
+    ),
+    pagelistEnvelopes=[
+        PageListEnvelope(
+            typeID=3,
+            length=124,
+            checksum=748677678342101309,
+            headerChecksum=1772847515747675522,
+            clusterSummaries=ListFrame(
+                fSize=36,
+                items=[
+                    ClusterSummary(
+                        fSize=24,
+                        fFirstEntryNumber=0,
+                        fNEntriesAndFeatureFlag=100,
+                    )
+                ],
+            ),
+            pageLocations=ListFrame(
+                fSize=64,
+                items=[
+                    ListFrame(
+                        fSize=52,
                         items=[
-                            ListFrame(
-                                fSize=52,
+                            PageLocations(
+                                fSize=40,
                                 items=[
-                                    PageLocations(
-                                        fSize=40,
-                                        items=[
-                                            RPageDescription(
-                                                fNElements=-100,
-                                                locator=StandardLocator(
-                                                    size=164, offset=1695
-                                                ),
-                                            )
-                                        ],
-                                        elementoffset=0,
-                                        compressionsettings=RCompressionSettings(505),
+                                    RPageDescription(
+                                        fNElements=-100,
+                                        locator=StandardLocator(size=138, offset=409),
                                     )
                                 ],
+                                elementoffset=0,
+                                compressionsettings=RCompressionSettings(505),
                             )
                         ],
+                    )
+                ],
+            ),
+        )
+    ],
+)
+
+MULTIPLE_A_SCHEMA_DESCRIPTION = SchemaDescription(
+    fieldDescriptions=[
+        FieldDescription(
+            fSize=46,
+            fFieldVersion=0,
+            fTypeVersion=0,
+            fParentFieldID=0,
+            fStructuralRole=0,
+            fFlags=0,
+            fFieldName=RString(fString=b"f"),
+            fTypeName=RString(fString=b"float"),
+            fTypeAlias=RString(fString=b""),
+            fFieldDescription=RString(fString=b""),
+            fArraySize=None,
+            fSourceFieldID=None,
+            fTypeChecksum=None,
+        )
+    ],
+    columnDescriptions=[
+        ColumnDescription(
+            fSize=20,
+            fColumnType=ColumnType.kSplitReal32,
+            fBitsOnStorage=32,
+            fFieldID=0,
+            fFlags=0,
+            fRepresentationIndex=0,
+            fFirstElementIndex=None,
+            fMinValue=None,
+            fMaxValue=None,
+        )
+    ],
+    aliasColumnDescriptions=[],
+    extraTypeInformations=[],
+)
+
+MULTIPLE_A_PAGE_DESCRIPTIONS = [  # PagelistEnvelopes
+    [  # Clusters (columnlists)
+        [  # Columns (pagelists)
+            [  # Pages (page descriptions)
+                InterpretablePage(
+                    pageDescription=RPageDescription(
+                        fNElements=-100,
+                        locator=StandardLocator(size=138, offset=409),
                     ),
+                    uncompressedSize=400,
+                    columnType=ColumnType.kSplitReal32,
                 )
-            ],
-        )
+            ]
+        ]
+    ]
+]
 
-        featureFlags_b = rntuple_b.featureFlags
-        assert featureFlags_b == RFeatureFlags(flags=0)
+MULTIPLE_B_ANCHOR = ROOT3a3aRNTuple(
+    fVersionEpoch=1,
+    fVersionMajor=0,
+    fVersionMinor=0,
+    fVersionPatch=0,
+    fSeekHeader=1542,
+    fNBytesHeader=111,
+    fLenHeader=171,
+    fSeekFooter=2037,
+    fNBytesFooter=82,
+    fLenFooter=148,
+    fMaxKeySize=1073741824,
+)
 
-        schemaDescription_b = rntuple_b.schemaDescription
-        assert schemaDescription_b == SchemaDescription(
-            fieldDescriptions=[
+MULTIPLE_B_RNTUPLE = RNTuple(
+    headerEnvelope=HeaderEnvelope(
+        typeID=1,
+        length=171,
+        checksum=14068653553654343426,
+        featureFlags=RFeatureFlags(flags=0),
+        fName=RString(fString=b"B"),
+        fDescription=RString(fString=b""),
+        fLibrary=RString(fString=b"ROOT v6.35.01"),
+        fieldDescriptions=ListFrame(
+            fSize=65,
+            items=[
                 FieldDescription(
                     fSize=53,
                     fFieldVersion=0,
@@ -777,7 +604,10 @@ def test_read_multiple_rntuples():
                     fTypeChecksum=None,
                 )
             ],
-            columnDescriptions=[
+        ),
+        columnDescriptions=ListFrame(
+            fSize=32,
+            items=[
                 ColumnDescription(
                     fSize=20,
                     fColumnType=ColumnType.kSplitInt32,
@@ -790,24 +620,295 @@ def test_read_multiple_rntuples():
                     fMaxValue=None,
                 )
             ],
-            aliasColumnDescriptions=[],
-            extraTypeInformations=[],
+        ),
+        aliasColumnDescriptions=ListFrame(fSize=12, items=[]),
+        extraTypeInformations=ListFrame(fSize=12, items=[]),
+    ),
+    footerEnvelope=FooterEnvelope(
+        typeID=2,
+        length=148,
+        checksum=17038928962946065552,
+        featureFlags=RFeatureFlags(flags=0),
+        headerChecksum=14068653553654343426,
+        schemaExtension=SchemaExtension(
+            fSize=56,
+            fieldDescriptions=ListFrame(fSize=12, items=[]),
+            columnDescriptions=ListFrame(fSize=12, items=[]),
+            aliasColumnDescriptions=ListFrame(fSize=12, items=[]),
+            extraTypeInformations=ListFrame(fSize=12, items=[]),
+        ),
+        clusterGroups=ListFrame(
+            fSize=60,
+            items=[
+                ClusterGroup(
+                    fSize=48,
+                    fMinEntryNumber=0,
+                    fEntrySpan=100,
+                    fNClusters=1,
+                    pagelistLink=REnvelopeLink(
+                        length=124,
+                        locator=StandardLocator(size=86, offset=1909),
+                    ),
+                )
+            ],
+        ),
+    ),
+    pagelistEnvelopes=[
+        PageListEnvelope(
+            typeID=3,
+            length=124,
+            checksum=674435399773528910,
+            headerChecksum=14068653553654343426,
+            clusterSummaries=ListFrame(
+                fSize=36,
+                items=[
+                    ClusterSummary(
+                        fSize=24,
+                        fFirstEntryNumber=0,
+                        fNEntriesAndFeatureFlag=100,
+                    )
+                ],
+            ),
+            pageLocations=ListFrame(
+                fSize=64,
+                items=[
+                    ListFrame(
+                        fSize=52,
+                        items=[
+                            PageLocations(
+                                fSize=40,
+                                items=[
+                                    RPageDescription(
+                                        fNElements=-100,
+                                        locator=StandardLocator(size=164, offset=1695),
+                                    )
+                                ],
+                                elementoffset=0,
+                                compressionsettings=RCompressionSettings(505),
+                            )
+                        ],
+                    )
+                ],
+            ),
         )
+    ],
+)
 
-        extended_page_descriptions_b = rntuple_b.get_extended_page_descriptions()
-        assert extended_page_descriptions_b == [  # PagelistEnvelopes
-            [  # Clusters (columnlists)
-                [  # Columns (pagelists)
-                    [  # Pages (page descriptions)
-                        InterpretablePage(
-                            pageDescription=RPageDescription(
-                                fNElements=-100,
-                                locator=StandardLocator(size=164, offset=1695),
-                            ),
-                            uncompressedSize=400,
-                            columnType=ColumnType.kSplitInt32,
-                        )
-                    ]
-                ]
+MULTIPLE_B_SCHEMA_DESCRIPTION = SchemaDescription(
+    fieldDescriptions=[
+        FieldDescription(
+            fSize=53,
+            fFieldVersion=0,
+            fTypeVersion=0,
+            fParentFieldID=0,
+            fStructuralRole=0,
+            fFlags=0,
+            fFieldName=RString(fString=b"g"),
+            fTypeName=RString(fString=b"std::int32_t"),
+            fTypeAlias=RString(fString=b""),
+            fFieldDescription=RString(fString=b""),
+            fArraySize=None,
+            fSourceFieldID=None,
+            fTypeChecksum=None,
+        )
+    ],
+    columnDescriptions=[
+        ColumnDescription(
+            fSize=20,
+            fColumnType=ColumnType.kSplitInt32,
+            fBitsOnStorage=32,
+            fFieldID=0,
+            fFlags=0,
+            fRepresentationIndex=0,
+            fFirstElementIndex=None,
+            fMinValue=None,
+            fMaxValue=None,
+        )
+    ],
+    aliasColumnDescriptions=[],
+    extraTypeInformations=[],
+)
+
+MULTIPLE_B_PAGE_DESCRIPTIONS = [  # PagelistEnvelopes
+    [  # Clusters (columnlists)
+        [  # Columns (pagelists)
+            [  # Pages (page descriptions)
+                InterpretablePage(
+                    pageDescription=RPageDescription(
+                        fNElements=-100,
+                        locator=StandardLocator(size=164, offset=1695),
+                    ),
+                    uncompressedSize=400,
+                    columnType=ColumnType.kSplitInt32,
+                )
             ]
         ]
+    ]
+]
+
+
+# TODO: Add test for a more complex RNTuple with complex schema and multiple clusters
+SINGLE_RNTUPLE_FILE = "rntviewer-testfile-uncomp-single-rntuple-v1-0-0-0.root"
+MULTIPLE_RNTUPLES_FILE = "rntviewer-testfile-multiple-rntuples-v1-0-0-0.root"
+
+RNTUPLE_CASES = [
+    pytest.param(
+        SINGLE_RNTUPLE_FILE,
+        "Contributors",
+        CONTRIBUTORS_ANCHOR,
+        CONTRIBUTORS_RNTUPLE,
+        CONTRIBUTORS_SCHEMA_DESCRIPTION,
+        CONTRIBUTORS_PAGE_DESCRIPTIONS,
+        id="contributors",
+    ),
+    pytest.param(
+        MULTIPLE_RNTUPLES_FILE,
+        "A",
+        MULTIPLE_A_ANCHOR,
+        MULTIPLE_A_RNTUPLE,
+        MULTIPLE_A_SCHEMA_DESCRIPTION,
+        MULTIPLE_A_PAGE_DESCRIPTIONS,
+        id="multiple-A",
+    ),
+    pytest.param(
+        MULTIPLE_RNTUPLES_FILE,
+        "B",
+        MULTIPLE_B_ANCHOR,
+        MULTIPLE_B_RNTUPLE,
+        MULTIPLE_B_SCHEMA_DESCRIPTION,
+        MULTIPLE_B_PAGE_DESCRIPTIONS,
+        id="multiple-B",
+    ),
+]
+
+
+@pytest.fixture(scope="session")
+def rntuple_file(request: pytest.FixtureRequest):
+    """Parse the file header and key list once per test file and session."""
+    path = Path(data_path(request.param))
+    with path.open("rb") as filehandle:
+        # Map the file once and serve every fetch as a view into it
+        mapped = mmap.mmap(filehandle.fileno(), 0, access=mmap.ACCESS_READ)
+    # Reads jump between anchor, envelopes and pages: skip read-ahead
+    if hasattr(mmap, "MADV_RANDOM"):
+        mapped.madvise(mmap.MADV_RANDOM)
+    filedata = memoryview(mapped)
+
+    def fetch_data(seek: int, size: int):
+        return ReadBuffer(
+            filedata[seek : seek + size],
+            0,
+            BOOTSTRAP_CONTEXT,
+            BufferContext(abspos=seek),
+        )
+
+    buffer = fetch_data(0, 512)
+    file, _ = ROOTFile.read(buffer)
+    tfile = file.get_TFile(fetch_data)
+    keylist = tfile.get_KeyList(fetch_data)
+    return keylist, fetch_data
+
+
+@pytest.mark.parametrize(
+    (
+        "rntuple_file",
+        "key",
+        "expected_anchor",
+        "expected_rntuple",
+        "expected_schema_description",
+        "expected_page_descriptions",
+    ),
+    RNTUPLE_CASES,
+    indirect=["rntuple_file"],
+)
+def test_read_rntuple(
+    rntuple_file: tuple[TKeyList, DataFetcher],
+    key: str,
+    expected_anchor: ROOT3a3aRNTuple,
+    expected_rntuple: RNTuple,
+    expected_schema_description: SchemaDescription,
+    expected_page_descriptions: list[list[list[list[InterpretablePage]]]],
+):
+    keylist, fetch_data = rntuple_file
+
+    def fetch_from_locator(loc):
+        return fetch_data(loc.offset, loc.size)
+
+    anchor = keylist[key].read_object(fetch_data, ROOT3a3aRNTuple)
+    assert anchor == expected_anchor
+
+    rntuple = RNTuple.from_anchor(anchor, fetch_from_locator)
+    assert rntuple == expected_rntuple
+
+    # Coalesced and concurrent envelope fetches must read the same RNTuple
+    assert RNTuple.from_anchor(anchor, fetch_from_locator, max_gap=4096) == rntuple
+    with ThreadPoolExecutor() as executor:
+        assert RNTuple.from_anchor(anchor, fetch_from_locator, executor) == rntuple
+        with pytest.raises(ValueError, match="mutually exclusive"):
+            RNTuple.from_anchor(anchor, fetch_from_locator, executor, max_gap=0)
+
+    assert rntuple.featureFlags == NO_FEATURE_FLAGS
+    assert rntuple.schemaDescription == expected_schema_description
+    assert rntuple.get_extended_page_descriptions() == expected_page_descriptions
+
+    # The per-column page helpers must agree with the full page descriptions
+    for columnIndex in range(len(expected_schema_description.columnDescriptions)):
+        expected_pages = [
+            (
+                page.pageDescription.offset,
+                page.pageDescription.size,
+                page.uncompressedSize,
+            )
+            for envelope in expected_page_descriptions
+            for cluster in envelope
+            for page in cluster[columnIndex]
+        ]
+        assert [
+            (
+                page.pageDescription.offset,
+                page.pageDescription.size,
+                page.uncompressedSize,
+            )
+            for page in rntuple.iter_column_pages(columnIndex)
+        ] == expected_pages
+        table = rntuple.get_column_pages(columnIndex)
+        assert (
+            list(
+                zip(
+                    table["offset"].tolist(),
+                    table["size"].tolist(),
+                    table["uncompressedSize"].tolist(),
+                    strict=True,
+                )
+            )
+            == expected_pages
+        )
+
+    # Fetching neighbouring pages together must not change their contents
+    pageDescriptions = [
+        page.pageDescription
+        for envelope in expected_page_descriptions
+        for cluster in envelope
+        for column in cluster
+        for page in column
+    ]
+    assert get_pages(pageDescriptions, fetch_from_locator, max_gap=4096) == [
+        pageDescription.get_page(fetch_from_locator)
+        for pageDescription in pageDescriptions
+    ]
+
+
+@pytest.mark.parametrize("rntuple_file", [SINGLE_RNTUPLE_FILE], indirect=True)
+def test_envelope_checksum_mismatch(rntuple_file: tuple[TKeyList, DataFetcher]):
+    keylist, fetch_data = rntuple_file
+    anchor = keylist["Contributors"].read_object(fetch_data, ROOT3a3aRNTuple)
+    loc = anchor.header_locator
+
+    # Corrupt the last byte of the (uncompressed) header envelope checksum
+    data = bytearray(fetch_data(loc.offset, loc.size).data)
+    data[-1] ^= 0xFF
+    buffer = ReadBuffer(
+        memoryview(data), 0, BOOTSTRAP_CONTEXT, BufferContext(abspos=loc.offset)
+    )
+    with pytest.raises(ValueError, match="Checksum mismatch"):
+        loc.read_from(buffer)